@@ -35,7 +35,7 @@ def index():
     metadata = get_param_metadata()
     return render_template('index.html',
                          tabs=metadata['tabs'],
-                         constants=CONSTANTS)
+                         constants=dict(CONSTANTS))
 
 
 @app.route('/api/params', methods=['GET'])
@@ -202,7 +202,7 @@ def get_metadata():
 @app.route('/api/constants', methods=['GET'])
 def get_constants():
     """Get model constants."""
-    return jsonify(CONSTANTS)
+    return jsonify(dict(CONSTANTS))
 
 
 @app.route('/api/validate', methods=['POST'])
@@ -274,7 +274,7 @@ def render_tab(tab_id):
     return render_template(template,
                          tab_id=tab_id,
                          params=params,
-                         constants=CONSTANTS)
+                         constants=dict(CONSTANTS))
 
 
 # Output file download endpoints
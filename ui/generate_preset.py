@@ -17,7 +17,7 @@ import sys
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from input_generator import InputGenerator
+from input_generator import generate_in_file
 from presets.pmc9087297 import (
     PMC9087297_SCENARIOS,
     get_pmc9087297_scenario,
@@ -75,12 +75,6 @@ def get_preset_scenario(scenario_name):
                     f"Available scenarios: {', '.join(all_scenarios)}")
 
 
-def generate_in_file(params):
-    """Generate .in file content from parameters."""
-    generator = InputGenerator()
-    return generator.generate(params)
-
-
 def write_scenario_file(scenario_name, output_path, verbose=True):
     """Generate and write a single scenario to a file."""
     params = get_preset_scenario(scenario_name)
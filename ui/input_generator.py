@@ -6,12 +6,17 @@ Generates .in files with all keywords expected by SimContext.cpp.
 
 # Constants matching SimContext.h/cpp
 # Exact strings from SimContext.cpp in INDEX order (0 to N-1)
-CD4_STRATA_STRS = ['CD4vlo', 'CD4_lo', 'CD4mlo', 'CD4mhi', 'CD4_hi', 'CD4vhi']
-HVL_STRATA_STRS = ['HVLvlo', 'HVL_lo', 'HVLmlo', 'HVLmed', 'HVLmhi', 'HVL_hi', 'HVLvhi']
+CD4_STRATA_STRS = ('CD4vlo', 'CD4_lo', 'CD4mlo', 'CD4mhi', 'CD4_hi', 'CD4vhi')
+HVL_STRATA_STRS = ('HVLvlo', 'HVL_lo', 'HVLmlo', 'HVLmed', 'HVLmhi', 'HVL_hi', 'HVLvhi')
 # Reversed for SimContext iteration (high index to low)
-CD4_STRATA_REV = list(reversed(CD4_STRATA_STRS))  # CD4vhi first
-HVL_STRATA_REV = list(reversed(HVL_STRATA_STRS))  # HVLvhi first
-TRANSM_RISK_STRS = ['MSM', 'IDU', 'Other']
+CD4_STRATA_REV = tuple(reversed(CD4_STRATA_STRS))  # CD4vhi first
+HVL_STRATA_REV = tuple(reversed(HVL_STRATA_STRS))  # HVLvhi first
+TRANSM_RISK_STRS = ('MSM', 'IDU', 'Other')
+PEDS_AGE_CAT_STRS = ('0-2mth', '3-5mth', '6-8mth', '9-11mth', '12-14mth', '15-17mth',
+                     '18-23mth', '2yr', '3yr', '4yr', '>4yr')
+PEDS_CD4_PERC_STRS = ('0-5perc', '5-10perc', '10-15perc', '15-20perc',
+                      '20-25perc', '25-30perc', '30-35perc', '>35perc')
+RISK_FACT_STRS = ('Risk1', 'Risk2', 'Risk3', 'Risk4', 'Risk5')
 OI_NUM = 15
 ART_NUM_LINES = 10
 PROPH_NUM = 3
@@ -35,6 +40,31 @@ CHRM_AGE_CAT_NUM = 7
 CHRM_ORPHANS_AGE_CAT_NUM = 4
 CHRM_TIME_PER_NUM = 3
 GENDER_NUM = 2
+ADOLESCENT_NUM_AGES = 18
+OI_NAMES = tuple(f'OI{i+1}' for i in range(OI_NUM))
+
+
+def _const_block(keyword, labels, value, num_values):
+    """Format one `keyword label v v ...` row per label, all with the same value."""
+    values = '\t'.join([value] * num_values)
+    return '\n'.join(f"{keyword}\t{label}\t{values}" for label in labels)
+
+
+# Static OI x OI (or OI x ART line) zero blocks in the peds sections,
+# formatted once at import rather than row by row on every generate()
+_OI_ZERO_BLOCK = {
+    name: _const_block(name, OI_NAMES, '0', n)
+    for name, n in (('PriProphStartPeds', OI_NUM), ('PriProphStopPeds', OI_NUM),
+                    ('SecProphStartPeds', OI_NUM), ('SecProphStopPeds', OI_NUM),
+                    ('PedsARTstart_OIs', ART_NUM_LINES), ('PedsARTfail_OIs', ART_NUM_LINES))
+}
+
+# Adolescent death rate ratios default to 1 for every CD4 stratum and age
+_ADOLESCENT_CD4_ONES_BLOCK = {
+    name: _const_block(name, CD4_STRATA_REV, '1', ADOLESCENT_NUM_AGES)
+    for name in ('HIVDthRateRatio_Adolescent', 'AcuteOIDthRateRatio_Adolescent',
+                 'AcuteOIDthRateRatioTB_Adolescent')
+}
 
 
 class InputGenerator:
@@ -91,20 +121,21 @@ class InputGenerator:
         self._gen_adolescent()
         self._gen_adolescent_arts()
 
+        # Sections only append to self.lines; the file is assembled in one join
         return '\n'.join(self.lines)
 
     def _w(self, keyword, *values):
         """Write keyword with values."""
         if len(values) == 1 and isinstance(values[0], (list, tuple)):
             values = values[0]
-        formatted = '\t'.join(self._fmt(v) for v in values)
+        formatted = '\t'.join(map(self._fmt, values))
         self.lines.append(f"{keyword}\t{formatted}")
 
     def _w2(self, kw1, kw2, *values):
         """Write double-keyword line."""
         if len(values) == 1 and isinstance(values[0], (list, tuple)):
             values = values[0]
-        formatted = '\t'.join(self._fmt(v) for v in values)
+        formatted = '\t'.join(map(self._fmt, values))
         self.lines.append(f"{kw1}\t{kw2}\t{formatted}")
 
     def _fmt(self, v):
@@ -1073,12 +1104,6 @@ class InputGenerator:
         PEDS_EXPOSED_CONDITIONS_NUM = 4
         RISK_FACT_NUM = 5
 
-        PEDS_AGE_CAT_STRS = ["0-2mth", "3-5mth", "6-8mth", "9-11mth", "12-14mth", "15-17mth",
-                            "18-23mth", "2yr", "3yr", "4yr", ">4yr"]
-        PEDS_CD4_PERC_STRS = ["0-5perc", "5-10perc", "10-15perc", "15-20perc",
-                              "20-25perc", "25-30perc", "30-35perc", ">35perc"]
-        RISK_FACT_STRS = ["Risk1", "Risk2", "Risk3", "Risk4", "Risk5"]
-
         self._w('EnablePeds', 0)
         self._w('InitAgePeds', 0.0, 0.0)
         self._w('DistMatStat', *([0.0] * PEDS_MATERNAL_STATUS_NUM))
@@ -1214,16 +1239,12 @@ class InputGenerator:
         for cd4 in CD4_STRATA_REV:
             self._w2('RateMultOIsPedsLate', cd4, *([1.0] * OI_NUM))
 
-        # OI names for prophylaxis (must match OIstrs from run specs)
-        OI_NAMES = [f'OI{i+1}' for i in range(OI_NUM)]
-
         # Primary OI prophylaxis starting criteria
         self._w2('PriProphStartPeds', 'agelwr', *([0.0] * OI_NUM))
         self._w2('PriProphStartPeds', 'ageupp', *([999.0] * OI_NUM))
         self._w2('PriProphStartPeds', 'cd4Percupp', *([100.0] * OI_NUM))
         self._w2('PriProphStartPeds', 'cd4Perclwr', *([0.0] * OI_NUM))
-        for j in range(OI_NUM):
-            self._w2('PriProphStartPeds', OI_NAMES[j], *([0] * OI_NUM))
+        self.lines.append(_OI_ZERO_BLOCK['PriProphStartPeds'])
         self._w('PriProphStartPeds_CondFirst', 0)
         self._w('PriProphStartPeds_CondSecond', 0)
         self._w('PriProphStartPeds_CondPar', 0)
@@ -1231,8 +1252,7 @@ class InputGenerator:
         # Primary OI prophylaxis stopping criteria
         self._w2('PriProphStopPeds', 'agelwr', *([0.0] * OI_NUM))
         self._w2('PriProphStopPeds', 'CD4Perclwr', *([0.0] * OI_NUM))
-        for j in range(OI_NUM):
-            self._w2('PriProphStopPeds', OI_NAMES[j], *([0] * OI_NUM))
+        self.lines.append(_OI_ZERO_BLOCK['PriProphStopPeds'])
         self._w2('PriProphStopPeds', 'mthsOnProph', *([0] * OI_NUM))
         self._w('PriProphStopPeds_CondFirst', 0)
         self._w('PriProphStopPeds_CondSecond', 0)
@@ -1243,8 +1263,7 @@ class InputGenerator:
         self._w2('SecProphStartPeds', 'ageupp', *([999.0] * OI_NUM))
         self._w2('SecProphStartPeds', 'cd4Percupp', *([100.0] * OI_NUM))
         self._w2('SecProphStartPeds', 'cd4Perclwr', *([0.0] * OI_NUM))
-        for j in range(OI_NUM):
-            self._w2('SecProphStartPeds', OI_NAMES[j], *([0] * OI_NUM))
+        self.lines.append(_OI_ZERO_BLOCK['SecProphStartPeds'])
         self._w('SecProphStartPeds_CondFirst', 0)
         self._w('SecProphStartPeds_CondSecond', 0)
         self._w('SecProphStartPeds_CondPar', 0)
@@ -1252,8 +1271,7 @@ class InputGenerator:
         # Secondary OI prophylaxis stopping criteria
         self._w2('SecProphStopPeds', 'agelwr', *([0.0] * OI_NUM))
         self._w2('SecProphStopPeds', 'CD4Perclwr', *([0.0] * OI_NUM))
-        for j in range(OI_NUM):
-            self._w2('SecProphStopPeds', OI_NAMES[j], *([0] * OI_NUM))
+        self.lines.append(_OI_ZERO_BLOCK['SecProphStopPeds'])
         self._w2('SecProphStopPeds', 'mthsOnProph', *([0] * OI_NUM))
         self._w('SecProphStopPeds_CondFirst', 0)
         self._w('SecProphStopPeds_CondSecond', 0)
@@ -1267,8 +1285,7 @@ class InputGenerator:
             self._w2(f'PedsARTstart_CD4Perc{i}', 'lwr', *([0.0] * ART_NUM_LINES))
         self._w2('PedsARTstart_HVL', 'upp', *([HVL_NUM_STRATA] * ART_NUM_LINES))
         self._w2('PedsARTstart_HVL', 'lwr', *([0] * ART_NUM_LINES))
-        for j in range(OI_NUM):
-            self._w2('PedsARTstart_OIs', OI_NAMES[j], *([0] * ART_NUM_LINES))
+        self.lines.append(_OI_ZERO_BLOCK['PedsARTstart_OIs'])
         self._w2('PedsARTstart_OIs', 'numOIs', *([0] * ART_NUM_LINES))
         self._w2('PedsARTstart', 'minMthNum', *([0] * ART_NUM_LINES))
         self._w2('PedsARTstart', 'MthsSincePrevRegStop', *([0] * ART_NUM_LINES))
@@ -1286,8 +1303,7 @@ class InputGenerator:
         self._w2('PedsARTfail_cd4AbsolAND', 'uppBnd', *([100.0] * ART_NUM_LINES))
         self._w2('PedsARTfail_cd4AbsolAND', 'lwrBnd', *([0.0] * ART_NUM_LINES))
         self._w('PedsARTfail_cd4MthsFromInit', *([0] * ART_NUM_LINES))
-        for j in range(OI_NUM):
-            self._w2('PedsARTfail_OIs', OI_NAMES[j], *([0] * ART_NUM_LINES))
+        self.lines.append(_OI_ZERO_BLOCK['PedsARTfail_OIs'])
         self._w('PedsARTfail_OIsMinNum', *([0] * ART_NUM_LINES))
         self._w('PedsARTfail_OIsMthsFromInit', *([0] * ART_NUM_LINES))
         self._w('PedsARTfail_diagNumTestsFail', *([1] * ART_NUM_LINES))
@@ -1307,7 +1323,6 @@ class InputGenerator:
 
     def _gen_peds_prophs(self):
         """Generate PedsProphs section (readPedsProphInputs)."""
-        OI_NAMES = [f'OI{i+1}' for i in range(OI_NUM)]
         PROPH_NUM = 3
 
         # Primary peds prophylaxis for each OI
@@ -1333,9 +1348,8 @@ class InputGenerator:
         PEDS_COST_AGE_CAT_NUM = 4
         COST_NUM_TYPES = 4
         DTH_NUM_CAUSES_BASIC = 17
-        OI_NAMES = [f'OI{i+1}' for i in range(OI_NUM)]
         # Death causes: OI1-OI15 (0-14), HIV (15), backgroundMort (16)
-        DTH_CAUSES_BASIC = OI_NAMES + ['HIV', 'backgroundMort']
+        DTH_CAUSES_BASIC = (*OI_NAMES, 'HIV', 'backgroundMort')
 
         for t in range(1, PEDS_COST_AGE_CAT_NUM + 1):
             # Acute OI costs
@@ -1506,8 +1520,6 @@ class InputGenerator:
 
     def _gen_adolescent(self):
         """Generate Adolescent section (readAdolescentInputs)."""
-        ADOLESCENT_NUM_AGES = 18
-        OI_NAMES = [f'OI{i+1}' for i in range(OI_NUM)]
 
         self._w('EnableAdolescent', 0)
         self._w('TransitionToAdult', 0)
@@ -1535,15 +1547,12 @@ class InputGenerator:
                 self._w2(f'Prob_{oi_name}_WithHist_OnART_Adolescent', cd4, *([0.0] * ADOLESCENT_NUM_AGES))
 
         # Death rate ratios
-        for cd4 in CD4_STRATA_REV:
-            self._w2('HIVDthRateRatio_Adolescent', cd4, *([1.0] * ADOLESCENT_NUM_AGES))
+        self.lines.append(_ADOLESCENT_CD4_ONES_BLOCK['HIVDthRateRatio_Adolescent'])
         self._w('ARTDthRateRatio_Adolescent', *([1.0] * ADOLESCENT_NUM_AGES))
         for i in range(RISK_FACT_NUM):
             self._w2('GenRiskDthRateRatio_Adolescent', f'Risk{i+1}', *([1.0] * ADOLESCENT_NUM_AGES))
-        for cd4 in CD4_STRATA_REV:
-            self._w2('AcuteOIDthRateRatio_Adolescent', cd4, *([1.0] * ADOLESCENT_NUM_AGES))
-        for cd4 in CD4_STRATA_REV:
-            self._w2('AcuteOIDthRateRatioTB_Adolescent', cd4, *([1.0] * ADOLESCENT_NUM_AGES))
+        self.lines.append(_ADOLESCENT_CD4_ONES_BLOCK['AcuteOIDthRateRatio_Adolescent'])
+        self.lines.append(_ADOLESCENT_CD4_ONES_BLOCK['AcuteOIDthRateRatioTB_Adolescent'])
         self._w('SevrOI_HistDthRateRatio_Adolescent', *([1.0] * ADOLESCENT_NUM_AGES))
         self._w('SevrOI_HistEffectDuration_Adolescent', 0)
         self._w('TB_OI_HistDthRateRatio_Adolescent', *([1.0] * ADOLESCENT_NUM_AGES))
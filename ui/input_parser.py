@@ -7,7 +7,22 @@ The .in format is keyword-based text where keywords mark the start of data secti
 
 import re
 import copy
-from param_schema import create_default_params, CONSTANTS, KEYWORD_MAP
+from bisect import bisect_left
+from itertools import compress, count
+from operator import itemgetter
+from param_schema import (
+    create_default_params, CONSTANTS, KEYWORD_MAP, PREFIX_TO_KEYWORDS,
+)
+
+# Comment stripping for _tokenize, applied to the whole content at once:
+# everything from the first // to end of line, then everything from the
+# first # to end of line when that line contains no quote characters
+_LINE_COMMENT = re.compile(r'//.*')
+_HASH_COMMENT = re.compile(r'^([^#"\'\n]*)#[^"\'\n]*$', re.MULTILINE)
+
+# Lowercased boolean spellings accepted by _read_bool
+_TRUE_STRINGS = frozenset({'true', '1', 'yes', 'y'})
+_FALSE_STRINGS = frozenset({'false', '0', 'no', 'n'})
 
 
 class InputParser:
@@ -17,6 +32,21 @@ class InputParser:
         self.params = None
         self.tokens = []
         self.pos = 0
+        # Keyword prefixes used to match exact keywords and composite ones
+        # like "ARTstart_CD4", grouped by first character for the batch scan
+        # in _find_keyword_positions
+        by_initial = {}
+        for prefix in PREFIX_TO_KEYWORDS:
+            by_initial.setdefault(prefix[0], []).append(prefix)
+        self._prefixes_by_initial = {c: tuple(ps) for c, ps in by_initial.items()}
+        # Reader for each scalar default type; lists are read recursively.
+        # Keyed on the exact type so bool is not mistaken for int
+        self._readers = {
+            bool: self._read_bool,
+            int: self._read_int,
+            float: self._read_float,
+            str: self._read_string,
+        }
 
     def parse_file(self, filepath):
         """Parse a .in file and return parameter dictionary."""
@@ -26,89 +56,92 @@ class InputParser:
 
     def parse_content(self, content):
         """Parse .in file content string and return parameter dictionary."""
-        # Start with defaults
+        # Start with defaults. Building them fresh is cheaper than restoring
+        # a cached template (pickle.loads or copy.deepcopy) of the same tree
         self.params = create_default_params()
 
         # Tokenize the content
         self.tokens = self._tokenize(content)
         self.pos = 0
 
-        # Parse by finding keywords and reading their associated values
-        while self.pos < len(self.tokens):
-            token = self.tokens[self.pos]
-
-            if self._is_keyword(token):
-                self._parse_keyword_section(token)
-            else:
-                self.pos += 1
+        # Parse by finding keywords and reading their associated values.
+        # Keyword positions are found in one pass over all tokens, so the
+        # loop jumps straight over the numeric blocks between them
+        tokens = self.tokens
+        keyword_positions = self._find_keyword_positions(tokens)
+        num_keywords = len(keyword_positions)
+        parse_section = self._parse_keyword_section
+        i = 0
+        while True:
+            i = bisect_left(keyword_positions, self.pos, i)
+            if i == num_keywords:
+                break
+            pos = keyword_positions[i]
+            self.pos = pos
+            parse_section(tokens[pos])
+        self.pos = len(tokens)
 
         return self.params
 
     def _tokenize(self, content):
         """Split content into tokens (whitespace-separated, handling strings)."""
-        # Remove comments (lines starting with # or //)
-        lines = content.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Remove // comments
-            if '//' in line:
-                line = line[:line.index('//')]
-            # Remove # comments (but not inside strings)
-            if '#' in line and not ('"' in line or "'" in line):
-                line = line[:line.index('#')]
-            cleaned_lines.append(line)
-
-        content = '\n'.join(cleaned_lines)
+        # Remove // comments, then # comments (but not on lines with strings)
+        content = _LINE_COMMENT.sub('', content)
+        content = _HASH_COMMENT.sub(r'\1', content)
 
         # Split on whitespace
-        tokens = content.split()
-        return tokens
-
-    def _is_keyword(self, token):
-        """Check if token is a known keyword."""
-        # Known keywords from SimContext.cpp readAndSkipPast calls
-        keywords = set(KEYWORD_MAP.keys())
-
-        # Also check for composite keywords like "ARTstart_CD4"
-        for kw in list(keywords):
-            if token.startswith(kw.split('_')[0]):
-                return True
-
-        return token in keywords
+        return content.split()
+
+    def _find_keyword_positions(self, tokens):
+        """Return the ascending indices of all tokens that are keywords."""
+        # Every exact keyword also starts with its own prefix, so the prefix
+        # test alone finds both exact and composite keywords. Most tokens are
+        # numbers, so first drop every token whose first character starts no
+        # prefix, in C via map/compress, then check the remaining candidates
+        by_initial = self._prefixes_by_initial
+        candidates = compress(count(), map(by_initial.__contains__, map(itemgetter(0), tokens)))
+        return [i for i in candidates if tokens[i].startswith(by_initial[tokens[i][0]])]
 
     def _parse_keyword_section(self, keyword):
         """Parse a section starting with a keyword."""
         self.pos += 1  # Move past keyword
 
         # Map keyword to parameter path
-        if keyword in KEYWORD_MAP:
-            tab, path = KEYWORD_MAP[keyword]
-            self._read_value_for_path(tab, path)
+        target = KEYWORD_MAP.get(keyword)
+        if target is not None:
+            self._read_value_for_path(*target)
         else:
             # Handle special/complex keywords
             self._handle_special_keyword(keyword)
 
-    def _read_value_for_path(self, tab, path):
+    def _read_value_for_path(self, tab, path, index=None):
         """Read value(s) and store in the appropriate parameter path."""
         if tab not in self.params:
             return
 
-        # Simple path (no array notation)
-        if '[' not in path:
-            param = self.params[tab].get(path)
-            if param is None:
-                return
-
-            if isinstance(param, bool):
-                self.params[tab][path] = self._read_bool()
-            elif isinstance(param, int):
-                self.params[tab][path] = self._read_int()
-            elif isinstance(param, float):
-                self.params[tab][path] = self._read_float()
-            elif isinstance(param, str):
-                self.params[tab][path] = self._read_string()
-            elif isinstance(param, list):
-                self._read_list_into(self.params[tab], path)
+        # Single element of a list parameter, e.g. monthRecordARTEfficacy[0]
+        if index is not None:
+            lst = self.params[tab].get(path)
+            if isinstance(lst, list) and index < len(lst):
+                reader = self._readers.get(type(lst[index]))
+                if reader is not None:
+                    lst[index] = reader()
+            return
+
+        param = self.params[tab].get(path)
+        if param is None:
+            return
+
+        if isinstance(param, bool):
+            self.params[tab][path] = self._read_bool()
+        elif isinstance(param, int):
+            self.params[tab][path] = self._read_int()
+        elif isinstance(param, float):
+            self.params[tab][path] = self._read_float()
+        elif isinstance(param, str):
+            self.params[tab][path] = self._read_string()
+        elif isinstance(param, list):
+            self._read_list_into(self.params[tab], path)
 
     def _read_list_into(self, parent, key):
         """Read values into a list parameter."""
@@ -116,39 +149,52 @@ class InputParser:
         if lst is None or not isinstance(lst, list):
             return
 
-        n = len(lst)
-        for i in range(n):
-            if self.pos >= len(self.tokens):
-                break
-
-            if isinstance(lst[i], bool):
-                lst[i] = self._read_bool()
-            elif isinstance(lst[i], int):
-                lst[i] = self._read_int()
-            elif isinstance(lst[i], float):
-                lst[i] = self._read_float()
-            elif isinstance(lst[i], str):
-                lst[i] = self._read_string()
-            elif isinstance(lst[i], list):
-                # Nested list - read recursively
-                self._read_nested_list(lst[i])
+        self._read_nested_list(lst)
 
     def _read_nested_list(self, lst):
         """Read values into a nested list."""
+        if self._read_numeric_run(lst):
+            return
+
+        readers = self._readers
+        num_tokens = len(self.tokens)
         for i in range(len(lst)):
-            if self.pos >= len(self.tokens):
+            if self.pos >= num_tokens:
                 break
 
-            if isinstance(lst[i], bool):
-                lst[i] = self._read_bool()
-            elif isinstance(lst[i], int):
-                lst[i] = self._read_int()
-            elif isinstance(lst[i], float):
-                lst[i] = self._read_float()
-            elif isinstance(lst[i], str):
-                lst[i] = self._read_string()
-            elif isinstance(lst[i], list):
-                self._read_nested_list(lst[i])
+            item = lst[i]
+            reader = readers.get(type(item))
+            if reader is not None:
+                lst[i] = reader()
+            elif isinstance(item, list):
+                self._read_nested_list(item)
+
+    def _read_numeric_run(self, lst):
+        """Read a flat list of all-int or all-float defaults in one slice.
+
+        Returns False without consuming tokens when the list is not
+        homogeneous or a token does not convert directly, so the caller can
+        fall back to reading element by element.
+        """
+        if not lst:
+            return False
+        t = type(lst[0])
+        if t is not float and t is not int:
+            return False
+        for item in lst:
+            if type(item) is not t:
+                return False
+
+        pos = self.pos
+        chunk = self.tokens[pos:pos + len(lst)]
+        try:
+            values = list(map(t, chunk))
+        except ValueError:
+            return False
+
+        lst[:len(values)] = values
+        self.pos = pos + len(values)
+        return True
 
     def _read_bool(self):
         """Read a boolean value."""
@@ -158,9 +204,10 @@ class InputParser:
         self.pos += 1
 
         # Handle various boolean representations
-        if token.lower() in ('true', '1', 'yes', 'y'):
+        lowered = token.lower()
+        if lowered in _TRUE_STRINGS:
             return True
-        elif token.lower() in ('false', '0', 'no', 'n'):
+        elif lowered in _FALSE_STRINGS:
             return False
         else:
             try:
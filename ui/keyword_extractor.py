@@ -3,6 +3,23 @@
 
 import re
 import json
+from bisect import bisect_left
+
+# Both keyword-reading calls share the readAndSkipPast prefix, so they are
+# fused into one alternation with named groups; keeping the literal prefix
+# lets the regex engine skip quickly to candidate positions.
+#   readAndSkipPast("keyword", ...)              -> kw1
+#   readAndSkipPast2("kw1", "kw2" | VAR, ...)    -> kw2a, kw2b
+# Whitespace and names are kept from spanning lines, as with a per-line scan.
+_READ_CALL = re.compile(
+    r'readAndSkipPast(?:'
+    r'[^\S\n]*\([^\S\n]*"(?P<kw1>[^"\n]+)"'
+    r'|2[^\S\n]*\([^\S\n]*"(?P<kw2a>[^"\n]+)"[^\S\n]*,[^\S\n]*"?(?P<kw2b>[^",\)\n]+)"?)'
+)
+# Track function context
+_FUNC = re.compile(r'void[^\S\n]+SimContext::(\w+)[^\S\n]*\(')
+_NEWLINE = re.compile(r'\n')
+
 
 def extract_keywords(filepath):
     """Parse SimContext.cpp and extract keywords with context."""
@@ -12,47 +29,46 @@ def extract_keywords(filepath):
 
     keywords = []
 
-    # Pattern for readAndSkipPast("keyword", ...)
-    p1 = re.compile(r'readAndSkipPast\s*\(\s*"([^"]+)"')
-    # Pattern for readAndSkipPast2("kw1", "kw2", ...) or readAndSkipPast2("kw1", VAR, ...)
-    p2 = re.compile(r'readAndSkipPast2\s*\(\s*"([^"]+)"\s*,\s*"?([^",\)]+)"?')
-    # Pattern for sprintf(buf, "format%d", num) followed by readAndSkipPast
-    p_sprintf = re.compile(r'sprintf\s*\(\s*\w+\s*,\s*"([^"]+)"')
-
-    # Track function context
-    func_pattern = re.compile(r'void\s+SimContext::(\w+)\s*\(')
-
-    lines = content.split('\n')
+    # Offsets of every newline; a match's line number is its bisect position
+    line_offsets = [m.start() for m in _NEWLINE.finditer(content)]
+    funcs = [(bisect_left(line_offsets, m.start()) + 1, m.group(1))
+             for m in _FUNC.finditer(content)]
+    next_func = 0
     current_func = None
+    # Only the first single/double keyword call on a line is recorded
+    last_single_line = last_double_line = 0
+
+    for m in _READ_CALL.finditer(content):
+        line = bisect_left(line_offsets, m.start()) + 1
 
-    for i, line in enumerate(lines):
-        # Update function context
-        m = func_pattern.search(line)
-        if m:
-            current_func = m.group(1)
+        # Update function context (a definition applies to its own line)
+        while next_func < len(funcs) and funcs[next_func][0] <= line:
+            current_func = funcs[next_func][1]
+            next_func += 1
 
-        # Check for readAndSkipPast
-        m1 = p1.search(line)
-        if m1:
+        if m.lastgroup == 'kw1':
+            if line == last_single_line:
+                continue
+            last_single_line = line
             keywords.append({
-                'keyword': m1.group(1),
+                'keyword': m.group('kw1'),
                 'func': current_func,
-                'line': i + 1,
+                'line': line,
                 'type': 'single'
             })
-
-        # Check for readAndSkipPast2
-        m2 = p2.search(line)
-        if m2:
-            kw2 = m2.group(2).strip()
+        else:
+            if line == last_double_line:
+                continue
+            last_double_line = line
+            kw2 = m.group('kw2b').strip()
             # Skip variable references
             if not kw2.startswith(('OI_STRS', 'CD4_STRATA', 'HVL_STRATA',
                                    'RISK_FACT', 'GENDER', 'HIST_OI', 'CHRM_STRS')):
                 keywords.append({
-                    'keyword': m2.group(1),
+                    'keyword': m.group('kw2a'),
                     'keyword2': kw2,
                     'func': current_func,
-                    'line': i + 1,
+                    'line': line,
                     'type': 'double'
                 })
 
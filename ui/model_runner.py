@@ -5,12 +5,38 @@ Compiles and executes the CEPAC model, capturing output.
 """
 
 import os
+import hashlib
 import subprocess
 import tempfile
 import shutil
 import platform
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    # Windows: persistent run directories are used without a lock
+    fcntl = None
+
+# Compiler flags shared by the per-file compile and link steps. -march=native
+# targets the machine the UI runs on, which is the only place this executable
+# is used
+CXXFLAGS = ['-std=c++11', '-O3', '-pipe', '-march=native']
+if platform.system() == 'Linux':
+    # Direct GOT calls instead of PLT stubs; only meaningful for ELF targets
+    CXXFLAGS.append('-fno-plt')
+
+# Link-time optimization moves all code generation into the link step, which
+# would undo the per-file incremental rebuild, so it is only used for profile
+# builds, which recompile every file anyway
+LTO_FLAGS = ['-flto=auto']
+
+# Files a previous run leaves in a persistent run directory. CEPAC runs every
+# .in it finds, and run() reads the outputs back, so these are cleared first
+_STALE_RUN_FILES = ('*.in', '*.out', '*.cout', '*.trace')
+
 
 class ModelRunner:
     """Runs the CEPAC simulation model."""
@@ -30,50 +56,109 @@ class ModelRunner:
         if self.executable.exists():
             # Check if any source file is newer than executable
             exe_mtime = self.executable.stat().st_mtime
-            needs_recompile = False
-
-            for src in self.cepac_dir.glob('*.cpp'):
-                if src.stat().st_mtime > exe_mtime:
-                    needs_recompile = True
-                    break
-
-            for hdr in self.cepac_dir.glob('*.h'):
-                if hdr.stat().st_mtime > exe_mtime:
-                    needs_recompile = True
-                    break
+            needs_recompile = any(
+                mtime > exe_mtime for _, mtime, _ in self._scan_sources()
+            )
 
             if not needs_recompile:
                 return True, "Executable is up to date"
 
         return self.compile()
 
-    def compile(self):
-        """Compile the CEPAC model."""
+    def compile(self, profile=None):
+        """
+        Compile the CEPAC model.
+
+        Each .cpp is compiled to build/<flags>/<name>.o in parallel, where
+        <flags> is a hash of the compiler command, skipping files whose object
+        is newer than the source and every header. The objects are linked in
+        the same directory, and the result replaces the executable only once
+        the link succeeds. ccache is used if installed.
+
+        Args:
+            profile: None for a normal build, 'generate' for an instrumented
+                build that records branch profiles into build/pgo-data/, or
+                'use' to optimize with the recorded profiles and LTO. Profile
+                builds go to build/pgo/ and always recompile every file. The
+                instrumented executable is left in build/pgo/ and never
+                replaces the executable.
+        """
         try:
-            cmd = [
-                'g++',
-                '-o', str(self.executable),
-                '-std=c++11',
-                '-O3',
-            ] + [str(f) for f in self.cepac_dir.glob('*.cpp')]
+            build_root = self.cepac_dir / 'build'
+            pgo_dir = build_root / 'pgo-data'
+            if profile == 'generate':
+                # Stale counts from older sources only produce mismatch warnings
+                shutil.rmtree(pgo_dir, ignore_errors=True)
+                flags = CXXFLAGS + LTO_FLAGS + [f'-fprofile-generate={pgo_dir}']
+            elif profile == 'use':
+                flags = CXXFLAGS + LTO_FLAGS + [f'-fprofile-use={pgo_dir}', '-fprofile-correction']
+            elif profile is None:
+                flags = CXXFLAGS
+            else:
+                return False, f"Unknown profile mode: {profile}"
+
+            entries = self._scan_sources()
+            hdr_max_mtime = max(
+                (mtime for name, mtime, _ in entries if name.endswith('.h')),
+                default=0.0,
+            )
+
+            compiler = ['ccache', 'g++'] if shutil.which('ccache') else ['g++']
+
+            # Instrumented and optimized builds must share object paths, since
+            # g++ names each profile after the object it was recorded for.
+            # Normal builds get a directory per flag set, so objects built
+            # with other flags are never linked in
+            if profile is not None:
+                build_dir = build_root / 'pgo'
+            else:
+                flag_key = hashlib.sha1(' '.join(compiler + flags).encode()).hexdigest()[:12]
+                build_dir = build_root / flag_key
+            build_dir.mkdir(parents=True, exist_ok=True)
+            objects = []
+            jobs = []
+            for name, mtime, path in entries:
+                if not name.endswith('.cpp'):
+                    continue
+                obj = build_dir / (name[:-len('.cpp')] + '.o')
+                objects.append(str(obj))
+                try:
+                    obj_mtime = obj.stat().st_mtime
+                except FileNotFoundError:
+                    obj_mtime = None
+                if (profile is not None or obj_mtime is None
+                        or max(mtime, hdr_max_mtime) > obj_mtime):
+                    jobs.append(compiler + flags + ['-c', path, '-o', str(obj)])
 
             # On Windows, hide the console window for subprocess
             kwargs = {}
             if platform.system() == 'Windows':
                 kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
 
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.cepac_dir),
-                capture_output=True,
-                text=True,
-                timeout=120,
-                **kwargs
-            )
+            def run_step(cmd):
+                return subprocess.run(
+                    cmd,
+                    cwd=str(self.cepac_dir),
+                    capture_output=True,
+                    text=True,
+                    timeout=120,
+                    **kwargs
+                )
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+                results = list(pool.map(run_step, jobs))
+
+            errors = [r.stderr for r in results if r.returncode != 0]
+            if errors:
+                return False, "Compilation failed:\n" + '\n'.join(errors)
 
+            linked = build_dir / self.executable.name
+            result = run_step(compiler + flags + ['-o', str(linked)] + objects)
             if result.returncode != 0:
-                return False, f"Compilation failed:\n{result.stderr}"
+                return False, f"Linking failed:\n{result.stderr}"
 
+            if profile != 'generate':
+                os.replace(linked, self.executable)
             return True, "Compilation successful"
 
         except subprocess.TimeoutExpired:
@@ -81,18 +166,66 @@ class ModelRunner:
         except Exception as e:
             return False, f"Compilation error: {str(e)}"
 
-    def run(self, input_file_content, run_name='uirun'):
+    def compile_pgo(self, training_input, run_name='pgo'):
+        """
+        Build an optimized executable with profile-guided optimization.
+
+        Compiles an instrumented executable, runs it once on training_input
+        (a representative .in file's content) to record branch profiles, and
+        recompiles using those profiles. The executable is only replaced by
+        the final optimized build, so a failed step leaves it untouched.
+        """
+        ok, msg = self.compile(profile='generate')
+        if not ok:
+            return ok, msg
+
+        instrumented = self.cepac_dir / 'build' / 'pgo' / self.executable.name
+        result = self._execute(instrumented, training_input, run_name)
+        if not result['success']:
+            return False, f"PGO training run failed:\n{result['message']}"
+
+        return self.compile(profile='use')
+
+    def _scan_sources(self):
+        """
+        List the C++ sources and headers in the CEPAC directory.
+
+        Returns (name, mtime, path) tuples from a single os.scandir pass,
+        which reuses the directory entry's stat data where the OS provides it.
+        """
+        with os.scandir(self.cepac_dir) as it:
+            return [
+                (e.name, e.stat().st_mtime, e.path)
+                for e in it
+                if e.name.endswith(('.cpp', '.h')) and e.is_file()
+            ]
+
+    def run(self, input_file_content, run_name='uirun', persistent=False):
         """
         Run the CEPAC model with given input.
 
         Args:
             input_file_content: Content of the .in file as string
             run_name: Name for the run (used for file naming)
+            persistent: Reuse .uiruns/<run_name> under the CEPAC directory
+                instead of creating and removing a temporary directory
 
         Returns:
             dict with keys: success, message, output, cout, popstats, trace
         """
-        result = {
+        # Ensure compiled
+        compile_ok, compile_msg = self.compile_if_needed()
+        if not compile_ok:
+            result = self._empty_result()
+            result['message'] = compile_msg
+            return result
+
+        return self._execute(self.executable, input_file_content, run_name, persistent)
+
+    @staticmethod
+    def _empty_result():
+        """Return a failed run result with every output field empty."""
+        return {
             'success': False,
             'message': '',
             'output': '',
@@ -101,14 +234,19 @@ class ModelRunner:
             'trace': '',
         }
 
-        # Ensure compiled
-        compile_ok, compile_msg = self.compile_if_needed()
-        if not compile_ok:
-            result['message'] = compile_msg
-            return result
-
-        # Create temporary directory for run
-        with tempfile.TemporaryDirectory(prefix='cepac_') as tmpdir:
+    def _execute(self, executable, input_file_content, run_name, persistent=False):
+        """Run the given executable on the input; see run() for the result."""
+        result = self._empty_result()
+
+        # Create temporary directory for run, or reuse the persistent one
+        if persistent:
+            if not self._is_safe_run_name(run_name):
+                result['message'] = f"Invalid run name for a persistent run: {run_name!r}"
+                return result
+            rundir = self._persistent_rundir(run_name)
+        else:
+            rundir = tempfile.TemporaryDirectory(prefix='cepac_')
+        with rundir as tmpdir:
             tmpdir = Path(tmpdir)
 
             # Write input file
@@ -118,58 +256,54 @@ class ModelRunner:
 
             try:
                 # Run CEPAC
-                cmd = [str(self.executable), str(tmpdir)]
+                cmd = [str(executable), str(tmpdir)]
                 # On Windows, hide the console window for subprocess
                 kwargs = {}
                 if platform.system() == 'Windows':
                     kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
 
-                proc_result = subprocess.run(
-                    cmd,
-                    cwd=str(self.cepac_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=600,  # 10 minute timeout
-                    **kwargs
-                )
-
-                result['message'] = proc_result.stdout
-                if proc_result.returncode != 0:
-                    result['message'] += f"\n\nStderr:\n{proc_result.stderr}"
+                # Send console output straight to files in the run directory
+                # rather than buffering it in pipes for the whole run
+                stdout_path = tmpdir / 'cepac_stdout.log'
+                stderr_path = tmpdir / 'cepac_stderr.log'
+                with open(stdout_path, 'wb') as out, open(stderr_path, 'wb') as err:
+                    proc = subprocess.Popen(
+                        cmd,
+                        cwd=str(self.cepac_dir),
+                        stdout=out,
+                        stderr=err,
+                        **kwargs
+                    )
+                    try:
+                        returncode = proc.wait(timeout=600)  # 10 minute timeout
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+                        proc.wait()
+                        raise
+
+                result['message'] = self._read_output([tmpdir], stdout_path.name)
+                if returncode != 0:
+                    stderr = self._read_output([tmpdir], stderr_path.name)
+                    result['message'] += f"\n\nStderr:\n{stderr}"
                     result['success'] = False
                     return result
 
                 # Read output files - CEPAC puts them in results/ subdirectory or root
                 results_dir = tmpdir / 'results'
+                output_dirs = [results_dir, tmpdir] if results_dir.exists() else [tmpdir]
 
-                # Check both locations for output files
-                out_file = results_dir / f'{run_name}.out' if results_dir.exists() else tmpdir / f'{run_name}.out'
-                if not out_file.exists():
-                    out_file = tmpdir / f'{run_name}.out'
-                if out_file.exists():
-                    with open(out_file, 'r') as f:
-                        result['output'] = f.read()
-
-                cout_file = results_dir / f'{run_name}.cout' if results_dir.exists() else tmpdir / f'{run_name}.cout'
-                if not cout_file.exists():
-                    cout_file = tmpdir / f'{run_name}.cout'
-                if cout_file.exists():
-                    with open(cout_file, 'r') as f:
-                        result['cout'] = f.read()
-
-                popstats_file = results_dir / 'popstats.out' if results_dir.exists() else tmpdir / 'popstats.out'
-                if not popstats_file.exists():
-                    popstats_file = tmpdir / 'popstats.out'
-                if popstats_file.exists():
-                    with open(popstats_file, 'r') as f:
-                        result['popstats'] = f.read()
-
-                # Look for trace files in both locations
-                search_dirs = [tmpdir, results_dir] if results_dir.exists() else [tmpdir]
-                for search_dir in search_dirs:
+                result['output'] = self._read_output(output_dirs, f'{run_name}.out')
+                result['cout'] = self._read_output(output_dirs, f'{run_name}.cout')
+                result['popstats'] = self._read_output(output_dirs, 'popstats.out')
+
+                # Look for trace files in both locations; collect the sections
+                # and join once rather than growing one string per file
+                trace_parts = []
+                for search_dir in reversed(output_dirs):
                     for trace_file in search_dir.glob('*.trace'):
                         with open(trace_file, 'r') as f:
-                            result['trace'] += f"=== {trace_file.name} ===\n{f.read()}\n"
+                            trace_parts.append(f"=== {trace_file.name} ===\n{f.read()}\n")
+                result['trace'] = ''.join(trace_parts)
 
                 result['success'] = True
 
@@ -180,13 +314,61 @@ class ModelRunner:
 
         return result
 
+    @staticmethod
+    def _is_safe_run_name(run_name):
+        """Check run_name is a single path component usable under .uiruns/."""
+        if not run_name or run_name in ('.', '..'):
+            return False
+        return not any(sep and sep in run_name for sep in (os.sep, os.altsep))
+
+    @contextmanager
+    def _persistent_rundir(self, run_name):
+        """
+        Lock and clear .uiruns/<run_name>, yielding its path as a string.
+
+        The directory itself is kept between runs; the previous run's .in and
+        output files and its results/ directory are removed so CEPAC doesn't
+        pick up stale inputs and old outputs aren't read back.
+        """
+        runs_root = (self.cepac_dir / '.uiruns').resolve()
+        rundir = (runs_root / run_name).resolve()
+        if rundir.parent != runs_root:
+            raise ValueError(f"Run directory escapes {runs_root}: {run_name!r}")
+        rundir.mkdir(parents=True, exist_ok=True)
+
+        with open(rundir / '.lock', 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                for pattern in _STALE_RUN_FILES:
+                    for path in rundir.glob(pattern):
+                        path.unlink(missing_ok=True)
+                results_dir = rundir / 'results'
+                if results_dir.is_dir() and not results_dir.is_symlink():
+                    shutil.rmtree(results_dir, ignore_errors=True)
+                yield str(rundir)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_output(search_dirs, filename):
+        """Return the contents of the first search_dirs/filename found, or ''."""
+        for search_dir in search_dirs:
+            path = search_dir / filename
+            if path.exists():
+                with open(path, 'r') as f:
+                    return f.read()
+        return ''
+
     def get_status(self):
         """Get status of the model runner."""
+        names = [name for name, _, _ in self._scan_sources()]
         status = {
             'cepac_dir': str(self.cepac_dir),
             'executable_exists': self.executable.exists(),
-            'source_files': len(list(self.cepac_dir.glob('*.cpp'))),
-            'header_files': len(list(self.cepac_dir.glob('*.h'))),
+            'source_files': sum(name.endswith('.cpp') for name in names),
+            'header_files': sum(name.endswith('.h') for name in names),
         }
 
         if self.executable.exists():
@@ -10,6 +10,8 @@ Each parameter includes:
 - constraints: optional validation constraints
 """
 
+from types import MappingProxyType
+
 # Constants from SimContext.h
 CONSTANTS = {
     'AGE_YRS': 101,
@@ -82,42 +84,49 @@ CONSTANTS = {
     'OUTPUT_AGE_CAT_NUM': 14,
 }
 
+# Read-only view so importers can't change sizes the defaults depend on
+CONSTANTS = MappingProxyType(CONSTANTS)
+
+# Sizes used throughout the default builders, bound once as module globals
+OI_NUM = CONSTANTS['OI_NUM']
+CD4_NUM_STRATA = CONSTANTS['CD4_NUM_STRATA']
+HVL_NUM_STRATA = CONSTANTS['HVL_NUM_STRATA']
+ART_NUM_LINES = CONSTANTS['ART_NUM_LINES']
+GENDER_NUM = CONSTANTS['GENDER_NUM']
+CHRM_NUM = CONSTANTS['CHRM_NUM']
+CHRM_AGE_CAT_NUM = CONSTANTS['CHRM_AGE_CAT_NUM']
+PROPH_NUM_TYPES = CONSTANTS['PROPH_NUM_TYPES']
+PROPH_NUM = CONSTANTS['PROPH_NUM']
+RISK_FACT_NUM = CONSTANTS['RISK_FACT_NUM']
+RESP_AGE_CAT_NUM = CONSTANTS['RESP_AGE_CAT_NUM']
+HET_INTV_NUM_PERIODS = CONSTANTS['HET_INTV_NUM_PERIODS']
+
 # String constants
-CD4_STRATA_STRS = ['CD4vlo', 'CD4_lo', 'CD4mlo', 'CD4mhi', 'CD4_hi', 'CD4vhi']
-HVL_STRATA_STRS = ['HVLvlo', 'HVL_lo', 'HVLmlo', 'HVLmed', 'HVLmhi', 'HVL_hi', 'HVLvhi']
-GENDER_STRS = ['male', 'female']
-TRANSM_RISK_STRS = ['MSM', 'IDU', 'Other']
-TB_STRAIN_STRS = ['dsTB', 'mdrTB', 'xdrTB']
-TB_STATE_STRS = ['Uninfected', 'Latent', 'ActivePulm', 'ActiveExtrapulm', 'PrevTreated', 'TreatDefault']
-
-
-def create_default_params():
-    """Create a dictionary with all default parameter values."""
-    params = {
-        'runspecs': create_runspecs_defaults(),
-        'output': create_output_defaults(),
-        'cohort': create_cohort_defaults(),
-        'treatment': create_treatment_defaults(),
-        'ltfu': create_ltfu_defaults(),
-        'heterogeneity': create_heterogeneity_defaults(),
-        'sti': create_sti_defaults(),
-        'prophs': create_prophs_defaults(),
-        'arts': create_arts_defaults(),
-        'nathist': create_nathist_defaults(),
-        'chrms': create_chrms_defaults(),
-        'costs': create_costs_defaults(),
-        'tb': create_tb_defaults(),
-        'qol': create_qol_defaults(),
-        'hivtest': create_hivtest_defaults(),
-        'peds': create_peds_defaults(),
-        'pedsprophs': create_pedsprophs_defaults(),
-        'pedsarts': create_pedsarts_defaults(),
-        'pedscosts': create_pedscosts_defaults(),
-        'eid': create_eid_defaults(),
-        'adolescent': create_adolescent_defaults(),
-        'adolescentarts': create_adolescentarts_defaults(),
-    }
-    return params
+CD4_STRATA_STRS = ('CD4vlo', 'CD4_lo', 'CD4mlo', 'CD4mhi', 'CD4_hi', 'CD4vhi')
+HVL_STRATA_STRS = ('HVLvlo', 'HVL_lo', 'HVLmlo', 'HVLmed', 'HVLmhi', 'HVL_hi', 'HVLvhi')
+GENDER_STRS = ('male', 'female')
+TRANSM_RISK_STRS = ('MSM', 'IDU', 'Other')
+TB_STRAIN_STRS = ('dsTB', 'mdrTB', 'xdrTB')
+TB_STATE_STRS = ('Uninfected', 'Latent', 'ActivePulm', 'ActiveExtrapulm', 'PrevTreated', 'TreatDefault')
+
+# Default display names, formatted once; defaults take a list() copy
+_OI_NAMES = tuple(f'OI_{i+1}' for i in range(OI_NUM))
+_RISK_NAMES = tuple(f'Risk_{i+1}' for i in range(RISK_FACT_NUM))
+_CHRM_NAMES = tuple(f'CHRM_{i+1}' for i in range(CHRM_NUM))
+
+# Default CD4 strata upper bounds (all strata but the top one)
+_CD4_UPPER_BOUNDS = (50.0, 100.0, 200.0, 350.0, 500.0)
+
+
+def create_default_params(tabs=None):
+    """
+    Create a dictionary with all default parameter values.
+
+    If tabs is given, only those tabs (ids as in TAB_DEFAULTS) are built;
+    callers that need a single tab skip building the rest of the tree.
+    """
+    return {tab: build() for tab, build in TAB_DEFAULTS.items()
+            if tabs is None or tab in tabs}
 
 
 def create_runspecs_defaults():
@@ -134,17 +143,17 @@ def create_runspecs_defaults():
         'inputVersion': '20210615',
         'modelVersion': '50d',
         'OIsIncludeTB': False,
-        'OINames': [f'OI_{i+1}' for i in range(CONSTANTS['OI_NUM'])],
-        'OIsFractionOfBenefit': [1.0] * CONSTANTS['OI_NUM'],
-        'severeOIs': [False] * CONSTANTS['OI_NUM'],
-        'CD4StrataUpperBounds': [50.0, 100.0, 200.0, 350.0, 500.0],
+        'OINames': list(_OI_NAMES),
+        'OIsFractionOfBenefit': [1.0] * OI_NUM,
+        'severeOIs': [False] * OI_NUM,
+        'CD4StrataUpperBounds': list(_CD4_UPPER_BOUNDS),
         'longitLoggingLevel': 0,
-        'firstOIsLongitLogging': [0] * CONSTANTS['OI_NUM'],
+        'firstOIsLongitLogging': [0] * OI_NUM,
         'enableOIHistoryLogging': False,
         'numARTFailuresForOIHistoryLogging': 0,
         'CD4BoundsForOIHistoryLogging': [0.0, 2000.0],
         'HVLBoundsForOIHistoryLogging': [0, 6],
-        'OIsToExcludeOIHistoryLogging': [False] * CONSTANTS['OI_NUM'],
+        'OIsToExcludeOIHistoryLogging': [False] * OI_NUM,
         'enableMultipleDiscountRates': False,
         'multDiscountRatesCost': [0.0, 0.03, 0.05, 0.07],
         'multDiscountRatesBenefit': [0.0, 0.03, 0.05, 0.07],
@@ -163,12 +172,15 @@ def create_output_defaults():
 
 def create_cohort_defaults():
     """Cohort tab defaults."""
+    n_transm_risk = CONSTANTS['TRANSM_RISK_NUM']
+    n_transm_age = CONSTANTS['TRANSM_RISK_AGE_NUM']
+
     return {
         'initialCD4Mean': 500.0,
         'initialCD4StdDev': 200.0,
         'enableSquareRootTransform': True,
-        'initialHVLDistribution': [[0.0] * CONSTANTS['HVL_NUM_STRATA']
-                                   for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
+        'initialHVLDistribution': [[0.0] * HVL_NUM_STRATA
+                                   for _ in range(CD4_NUM_STRATA)],
         'initialAgeMean': 360.0,  # 30 years in months
         'initialAgeStdDev': 120.0,
         'useCustomAgeDist': False,
@@ -180,28 +192,28 @@ def create_cohort_defaults():
         'clinicVisitTypeDistribution': [0.0, 0.0, 1.0],
         'therapyImplementationDistribution': [0.0, 0.0, 1.0],
         'CD4ResponseTypeOnARTDistribution': [0.25, 0.25, 0.25, 0.25],
-        'probOIHistoryAtEntry': [[[0.0] * CONSTANTS['OI_NUM']
-                                  for _ in range(CONSTANTS['HVL_NUM_STRATA'])]
-                                 for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
-        'probRiskFactorPrev': [0.0] * CONSTANTS['RISK_FACT_NUM'],
-        'probRiskFactorIncid': [0.0] * CONSTANTS['RISK_FACT_NUM'],
-        'riskFactorNames': [f'Risk_{i+1}' for i in range(CONSTANTS['RISK_FACT_NUM'])],
+        'probOIHistoryAtEntry': [[[0.0] * OI_NUM
+                                  for _ in range(HVL_NUM_STRATA)]
+                                 for _ in range(CD4_NUM_STRATA)],
+        'probRiskFactorPrev': [0.0] * RISK_FACT_NUM,
+        'probRiskFactorIncid': [0.0] * RISK_FACT_NUM,
+        'riskFactorNames': list(_RISK_NAMES),
         'showTransmissionOutput': False,
-        'transmRateOnART': [[0.0] * CONSTANTS['HVL_NUM_STRATA']
-                           for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
-        'transmRateOnARTAcute': [0.0] * CONSTANTS['CD4_NUM_STRATA'],
-        'transmRateOffART': [[0.0] * CONSTANTS['HVL_NUM_STRATA']
-                            for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
-        'transmRateOffARTAcute': [0.0] * CONSTANTS['CD4_NUM_STRATA'],
+        'transmRateOnART': [[0.0] * HVL_NUM_STRATA
+                           for _ in range(CD4_NUM_STRATA)],
+        'transmRateOnARTAcute': [0.0] * CD4_NUM_STRATA,
+        'transmRateOffART': [[0.0] * HVL_NUM_STRATA
+                            for _ in range(CD4_NUM_STRATA)],
+        'transmRateOffARTAcute': [0.0] * CD4_NUM_STRATA,
         'transmUseHIVTestAcuteDefinition': False,
         'transmAcuteDuration': 3,
         'transmRateMultInterval': [12, 24],
         'transmRateMult': [1.0, 1.0, 1.0],
-        'transmRiskDistrib': [[[1.0/3] * CONSTANTS['TRANSM_RISK_NUM']
-                              for _ in range(CONSTANTS['TRANSM_RISK_AGE_NUM'])]
-                             for _ in range(CONSTANTS['GENDER_NUM'])],
+        'transmRiskDistrib': [[[1.0/3] * n_transm_risk
+                              for _ in range(n_transm_age)]
+                             for _ in range(GENDER_NUM)],
         'transmRiskMultBounds': [12, 24],
-        'transmRiskMult': [[1.0, 1.0, 1.0] for _ in range(CONSTANTS['TRANSM_RISK_NUM'])],
+        'transmRiskMult': [[1.0, 1.0, 1.0] for _ in range(n_transm_risk)],
         'useDynamicTransm': False,
         'dynamicTransmHRGTransmissions': 0.0,
         'dynamicTransmPropHRGAttributable': 0.0,
@@ -218,8 +230,8 @@ def create_cohort_defaults():
 
 def create_treatment_defaults():
     """Treatment tab defaults."""
-    n_lines = CONSTANTS['ART_NUM_LINES']
-    n_ois = CONSTANTS['OI_NUM']
+    n_lines = ART_NUM_LINES
+    n_ois = OI_NUM
 
     # ART start policy defaults
     def default_art_start():
@@ -273,6 +285,9 @@ def create_treatment_defaults():
             'nextLineAfterMajorTox': -1,
         }
 
+    # Scalar-only; shallow copies are independent
+    art_stop_template = default_art_stop()
+
     # Proph start/stop policy defaults
     def default_proph_start():
         return {
@@ -328,13 +343,13 @@ def create_treatment_defaults():
         'startART': [default_art_start() for _ in range(n_lines)],
         'enableSTIForART': [False] * n_lines,
         'failART': [default_art_fail() for _ in range(n_lines)],
-        'stopART': [default_art_stop() for _ in range(n_lines)],
+        'stopART': [art_stop_template.copy() for _ in range(n_lines)],
         'ARTResistancePriorRegimen': [[0.0] * n_lines for _ in range(n_lines)],
-        'ARTResistanceHVL': [0.0] * CONSTANTS['HVL_NUM_STRATA'],
+        'ARTResistanceHVL': [0.0] * HVL_NUM_STRATA,
         'startProph': [[default_proph_start() for _ in range(n_ois)]
-                       for _ in range(CONSTANTS['PROPH_NUM_TYPES'])],
+                       for _ in range(PROPH_NUM_TYPES)],
         'stopProph': [[default_proph_stop() for _ in range(n_ois)]
-                      for _ in range(CONSTANTS['PROPH_NUM_TYPES'])],
+                      for _ in range(PROPH_NUM_TYPES)],
     }
 
 
@@ -347,8 +362,8 @@ def create_ltfu_defaults():
         'useInterventionLTFU': False,
         'responseThresholdLTFU': [0.0, 0.0],
         'responseValueLTFU': [0.0, 0.0],
-        'responseThresholdPeriodLTFU': [[0.0, 0.0] for _ in range(CONSTANTS['HET_INTV_NUM_PERIODS'])],
-        'responseValuePeriodLTFU': [[0.0, 0.0] for _ in range(CONSTANTS['HET_INTV_NUM_PERIODS'])],
+        'responseThresholdPeriodLTFU': [[0.0, 0.0] for _ in range(HET_INTV_NUM_PERIODS)],
+        'responseValuePeriodLTFU': [[0.0, 0.0] for _ in range(HET_INTV_NUM_PERIODS)],
         'responseThresholdLTFUOffIntervention': [0.0, 0.0],
         'responseValueLTFUOffIntervention': [0.0, 0.0],
         'propGeneralMedicineCost': [0.0] * 6,  # HIV_CARE_NUM
@@ -358,13 +373,13 @@ def create_ltfu_defaults():
         'minMonthsRemainLost': 1,
         'regressionCoefficientsRTC': [0.0] * CONSTANTS['RTC_NUM_COEFF'],
         'CD4ThresholdRTC': 0.0,
-        'severeOIsRTC': [False] * CONSTANTS['OI_NUM'],
+        'severeOIsRTC': [False] * OI_NUM,
         'maxMonthsAfterObservedFailureToRestartRegimen': -1,
         'probRestartRegimenWithoutObservedFailure': 0.0,
         'recheckARTStartPoliciesAtRTC': False,
         'useProbSuppByPrevOutcome': False,
-        'probSuppressionWhenReturnToFailed': [0.0] * CONSTANTS['ART_NUM_LINES'],
-        'probSuppressionWhenReturnToSuppressed': [0.0] * CONSTANTS['ART_NUM_LINES'],
+        'probSuppressionWhenReturnToFailed': [0.0] * ART_NUM_LINES,
+        'probSuppressionWhenReturnToSuppressed': [0.0] * ART_NUM_LINES,
         'probResumeInterventionRTC': 0.0,
         'costResumeInterventionRTC': 0.0,
     }
@@ -375,60 +390,54 @@ def create_heterogeneity_defaults():
     return {
         'propRespondBaselineLogitMean': 0.0,
         'propRespondBaselineLogitStdDev': 0.0,
-        'propRespondAge': [0.0] * CONSTANTS['RESP_AGE_CAT_NUM'],
+        'propRespondAge': [0.0] * RESP_AGE_CAT_NUM,
         'propRespondAgeEarly': 0.0,
         'propRespondAgeLate': 0.0,
-        'propRespondCD4': [0.0] * CONSTANTS['CD4_NUM_STRATA'],
+        'propRespondCD4': [0.0] * CD4_NUM_STRATA,
         'propRespondFemale': 0.0,
         'propRespondHistoryOIs': 0.0,
         'propRespondPriorARTToxicity': 0.0,
-        'propRespondRiskFactor': [0.0] * CONSTANTS['RISK_FACT_NUM'],
-        'useIntervention': [False] * CONSTANTS['HET_INTV_NUM_PERIODS'],
-        'interventionDurationMean': [0.0] * CONSTANTS['HET_INTV_NUM_PERIODS'],
-        'interventionDurationSD': [0.0] * CONSTANTS['HET_INTV_NUM_PERIODS'],
-        'interventionAdjustmentMean': [0.0] * CONSTANTS['HET_INTV_NUM_PERIODS'],
-        'interventionAdjustmentSD': [0.0] * CONSTANTS['HET_INTV_NUM_PERIODS'],
-        'interventionAdjustmentDistribution': [0] * CONSTANTS['HET_INTV_NUM_PERIODS'],
-        'interventionCostInit': [0.0] * CONSTANTS['HET_INTV_NUM_PERIODS'],
-        'interventionCostMonthly': [0.0] * CONSTANTS['HET_INTV_NUM_PERIODS'],
+        'propRespondRiskFactor': [0.0] * RISK_FACT_NUM,
+        'useIntervention': [False] * HET_INTV_NUM_PERIODS,
+        'interventionDurationMean': [0.0] * HET_INTV_NUM_PERIODS,
+        'interventionDurationSD': [0.0] * HET_INTV_NUM_PERIODS,
+        'interventionAdjustmentMean': [0.0] * HET_INTV_NUM_PERIODS,
+        'interventionAdjustmentSD': [0.0] * HET_INTV_NUM_PERIODS,
+        'interventionAdjustmentDistribution': [0] * HET_INTV_NUM_PERIODS,
+        'interventionCostInit': [0.0] * HET_INTV_NUM_PERIODS,
+        'interventionCostMonthly': [0.0] * HET_INTV_NUM_PERIODS,
     }
 
 
 def create_sti_defaults():
     """STI tab defaults."""
-    n_lines = CONSTANTS['ART_NUM_LINES']
+    n_lines = ART_NUM_LINES
 
-    def default_initiation():
+    def default_policy():
+        # Criteria shared by interruption and endpoint policies
         return {
             'CD4BoundsOnly': [-1.0, -1.0],
             'HVLBoundsOnly': [-1, -1],
             'CD4BoundsWithHVL': [-1.0, -1.0],
             'HVLBoundsWithCD4': [-1, -1],
-            'OIHistory': [False] * CONSTANTS['OI_NUM'],
+            'OIHistory': [False] * OI_NUM,
             'numOIs': 0,
             'CD4BoundsWithOIs': [-1.0, -1.0],
-            'OIHistoryWithCD4': [False] * CONSTANTS['OI_NUM'],
+            'OIHistoryWithCD4': [False] * OI_NUM,
             'minMonthNum': 0,
             'maxMonthNum': -1,
             'monthsSincePrevRegimen': 0,
-            'monthsSinceARTStart': 0,
         }
 
+    def default_initiation():
+        policy = default_policy()
+        policy['monthsSinceARTStart'] = 0
+        return policy
+
     def default_endpoint():
-        return {
-            'CD4BoundsOnly': [-1.0, -1.0],
-            'HVLBoundsOnly': [-1, -1],
-            'CD4BoundsWithHVL': [-1.0, -1.0],
-            'HVLBoundsWithCD4': [-1, -1],
-            'OIHistory': [False] * CONSTANTS['OI_NUM'],
-            'numOIs': 0,
-            'CD4BoundsWithOIs': [-1.0, -1.0],
-            'OIHistoryWithCD4': [False] * CONSTANTS['OI_NUM'],
-            'minMonthNum': 0,
-            'maxMonthNum': -1,
-            'monthsSincePrevRegimen': 0,
-            'monthsSinceSTIStart': 0,
-        }
+        policy = default_policy()
+        policy['monthsSinceSTIStart'] = 0
+        return policy
 
     return {
         'firstInterruption': [default_initiation() for _ in range(n_lines)],
@@ -450,8 +459,8 @@ def create_prophs_defaults():
     """Prophs tab defaults - per proph type x OI x proph line."""
     def default_proph():
         return {
-            'primaryOIEfficacy': [0.0] * CONSTANTS['OI_NUM'],
-            'secondaryOIEfficacy': [0.0] * CONSTANTS['OI_NUM'],
+            'primaryOIEfficacy': [0.0] * OI_NUM,
+            'secondaryOIEfficacy': [0.0] * OI_NUM,
             'monthlyProbResistance': 0.0,
             'percentResistance': 0.0,
             'timeOfResistance': 0,
@@ -471,16 +480,33 @@ def create_prophs_defaults():
             'switchOnMajorToxicity': False,
         }
 
+    def copy_proph():
+        # Scalars are shared with the template; only the lists need new copies
+        proph = proph_template.copy()
+        proph['primaryOIEfficacy'] = [0.0] * n_ois
+        proph['secondaryOIEfficacy'] = [0.0] * n_ois
+        return proph
+
+    n_ois = OI_NUM
+    proph_template = default_proph()
+
     # [proph_type][oi][proph_line]
     return {
-        'prophData': [[[default_proph() for _ in range(CONSTANTS['PROPH_NUM'])]
-                       for _ in range(CONSTANTS['OI_NUM'])]
-                      for _ in range(CONSTANTS['PROPH_NUM_TYPES'])]
+        'prophData': [[[copy_proph() for _ in range(PROPH_NUM)]
+                       for _ in range(n_ois)]
+                      for _ in range(PROPH_NUM_TYPES)]
     }
 
 
 def create_arts_defaults():
     """ARTs tab defaults - per ART line."""
+    n_resp_types = CONSTANTS['CD4_RESPONSE_NUM_TYPES']
+    n_subregimens = CONSTANTS['ART_NUM_SUBREGIMENS']
+    n_tox_severity = CONSTANTS['ART_NUM_TOX_SEVERITY']
+    n_tox_per_severity = CONSTANTS['ART_NUM_TOX_PER_SEVERITY']
+    n_het_outcomes = CONSTANTS['HET_NUM_OUTCOMES']
+    n_restart_resp = CONSTANTS['RESP_NUM_TYPES']
+
     def default_toxicity():
         return {
             'toxicityName': '',
@@ -509,20 +535,20 @@ def create_arts_defaults():
             'forceFailAtMonth': -1,
             'stageBoundsCD4ChangeOnSuppART': [6, 24],
             'stageBoundCD4ChangeOnARTFail': 24,
-            'CD4ChangeOnSuppARTMean': [[0.0, 0.0, 0.0] for _ in range(CONSTANTS['CD4_RESPONSE_NUM_TYPES'])],
-            'CD4ChangeOnSuppARTStdDev': [[0.0, 0.0, 0.0] for _ in range(CONSTANTS['CD4_RESPONSE_NUM_TYPES'])],
-            'CD4MultiplierOnFailedART': [[1.0, 1.0] for _ in range(CONSTANTS['CD4_RESPONSE_NUM_TYPES'])],
+            'CD4ChangeOnSuppARTMean': [[0.0, 0.0, 0.0] for _ in range(n_resp_types)],
+            'CD4ChangeOnSuppARTStdDev': [[0.0, 0.0, 0.0] for _ in range(n_resp_types)],
+            'CD4MultiplierOnFailedART': [[1.0, 1.0] for _ in range(n_resp_types)],
             'secondaryCD4ChangeOnARTStdDev': 0.0,
             'monthlyCD4MultiplierOffARTPreSetpoint': [1.0, 1.0],
             'monthlyCD4MultiplierOffARTPostSetpoint': [1.0, 1.0],
             'monthlyProbHVLChange': [0.0, 0.0],
             'monthlyNumStrataHVLChange': [0, 0],
-            'toxicity': [[[default_toxicity() for _ in range(CONSTANTS['ART_NUM_TOX_PER_SEVERITY'])]
-                          for _ in range(CONSTANTS['ART_NUM_TOX_SEVERITY'])]
-                         for _ in range(CONSTANTS['ART_NUM_SUBREGIMENS'])],
-            'monthsToSwitchSubRegimen': [-1] * CONSTANTS['ART_NUM_SUBREGIMENS'],
+            'toxicity': [[[toxicity_template.copy() for _ in range(n_tox_per_severity)]
+                          for _ in range(n_tox_severity)]
+                         for _ in range(n_subregimens)],
+            'monthsToSwitchSubRegimen': [-1] * n_subregimens,
             'propMthCostNonResponders': 1.0,
-            'probRestartARTRegimenAfterFailure': [0.0] * CONSTANTS['RESP_NUM_TYPES'],
+            'probRestartARTRegimenAfterFailure': [0.0] * n_restart_resp,
             'maxRestartAttempts': 0,
             'propRespondARTRegimenLogitMean': 0.0,
             'propRespondARTRegimenLogitStdDev': 0.0,
@@ -530,40 +556,46 @@ def create_arts_defaults():
             'propRespondARTRegimenUseDuration': False,
             'propRespondARTRegimenDurationMean': 0.0,
             'propRespondARTRegimenDurationStdDev': 0.0,
-            'responseTypeThresholds': [[0.0, 0.0] for _ in range(CONSTANTS['HET_NUM_OUTCOMES'])],
-            'responseTypeValues': [[0.0, 0.0] for _ in range(CONSTANTS['HET_NUM_OUTCOMES'])],
-            'responseTypeExponents': [1.0] * CONSTANTS['HET_NUM_OUTCOMES'],
+            'responseTypeThresholds': [[0.0, 0.0] for _ in range(n_het_outcomes)],
+            'responseTypeValues': [[0.0, 0.0] for _ in range(n_het_outcomes)],
+            'responseTypeExponents': [1.0] * n_het_outcomes,
             'applyARTEffectOnFailed': False,
         }
 
+    # Toxicity entries hold only immutable scalars, so a shallow copy of one
+    # template is a complete, independent entry
+    toxicity_template = default_toxicity()
+
     return {
-        'artData': [default_art_line() for _ in range(CONSTANTS['ART_NUM_LINES'])]
+        'artData': [default_art_line() for _ in range(ART_NUM_LINES)]
     }
 
 
 def create_nathist_defaults():
     """NatHist tab defaults."""
+    n_age_yrs = CONSTANTS['AGE_YRS']
+
     return {
-        'HIVDeathRateRatio': [1.0] * CONSTANTS['CD4_NUM_STRATA'],
+        'HIVDeathRateRatio': [1.0] * CD4_NUM_STRATA,
         'ARTDeathRateRatio': 1.0,
-        'monthlyOIProbOffART': [[[0.0] * 2 for _ in range(CONSTANTS['OI_NUM'])]
-                                for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
-        'monthlyOIProbOnARTMult': [[1.0] * CONSTANTS['OI_NUM']
-                                   for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
-        'acuteOIDeathRateRatio': [1.0] * CONSTANTS['CD4_NUM_STRATA'],
-        'acuteOIDeathRateRatioTB': [1.0] * CONSTANTS['CD4_NUM_STRATA'],
+        'monthlyOIProbOffART': [[[0.0] * 2 for _ in range(OI_NUM)]
+                                for _ in range(CD4_NUM_STRATA)],
+        'monthlyOIProbOnARTMult': [[1.0] * OI_NUM
+                                   for _ in range(CD4_NUM_STRATA)],
+        'acuteOIDeathRateRatio': [1.0] * CD4_NUM_STRATA,
+        'acuteOIDeathRateRatioTB': [1.0] * CD4_NUM_STRATA,
         'severeOIHistDeathRateRatio': 1.0,
         'severeOIHistEffectDuration': 0,
         'TB_OIHistDeathRateRatio': 1.0,
         'TB_OIHistEffectDuration': 0,
-        'genericRiskDeathRateRatio': [1.0] * CONSTANTS['RISK_FACT_NUM'],
-        'monthlyCD4DeclineMean': [[0.0] * CONSTANTS['HVL_NUM_STRATA']
-                                  for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
-        'monthlyCD4DeclineStdDev': [[0.0] * CONSTANTS['HVL_NUM_STRATA']
-                                    for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
+        'genericRiskDeathRateRatio': [1.0] * RISK_FACT_NUM,
+        'monthlyCD4DeclineMean': [[0.0] * HVL_NUM_STRATA
+                                  for _ in range(CD4_NUM_STRATA)],
+        'monthlyCD4DeclineStdDev': [[0.0] * HVL_NUM_STRATA
+                                    for _ in range(CD4_NUM_STRATA)],
         'monthlyCD4DeclineBtwSubject': 0.0,
-        'monthlyBackgroundDeathRate': [[0.0] * CONSTANTS['AGE_YRS']
-                                        for _ in range(CONSTANTS['GENDER_NUM'])],
+        'monthlyBackgroundDeathRate': [[0.0] * n_age_yrs
+                                        for _ in range(GENDER_NUM)],
         'backgroundMortModifierType': 0,
         'backgroundMortModifier': 0.0,
     }
@@ -571,58 +603,61 @@ def create_nathist_defaults():
 
 def create_chrms_defaults():
     """CHRMs tab defaults."""
+    n_time_per = CONSTANTS['CHRM_TIME_PER_NUM']
+    n_orphans_age = CONSTANTS['CHRM_ORPHANS_AGE_CAT_NUM']
+
     return {
         'showCHRMsOutput': False,
-        'CHRMNames': [f'CHRM_{i+1}' for i in range(CONSTANTS['CHRM_NUM'])],
+        'CHRMNames': list(_CHRM_NAMES),
         'enableOrphans': False,
         'showOrphansOutput': False,
-        'ageBounds': [[0] * (CONSTANTS['CHRM_AGE_CAT_NUM'] - 1)
-                      for _ in range(CONSTANTS['CHRM_NUM'])],
-        'durationCHRMSstage': [[[0.0, 0.0] for _ in range(CONSTANTS['CHRM_NUM'])]
-                               for _ in range(CONSTANTS['CHRM_TIME_PER_NUM'] - 1)],
+        'ageBounds': [[0] * (CHRM_AGE_CAT_NUM - 1)
+                      for _ in range(CHRM_NUM)],
+        'durationCHRMSstage': [[[0.0, 0.0] for _ in range(CHRM_NUM)]
+                               for _ in range(n_time_per - 1)],
         'enableCHRMSDurationSqrtTransform': False,
-        'probPrevalentCHRMsHIVneg': [[[0.0] * CONSTANTS['CHRM_AGE_CAT_NUM']
-                                      for _ in range(CONSTANTS['GENDER_NUM'])]
-                                     for _ in range(CONSTANTS['CHRM_NUM'])],
-        'probPrevalentCHRMs': [[[[0.0] * CONSTANTS['CHRM_AGE_CAT_NUM']
-                                 for _ in range(CONSTANTS['GENDER_NUM'])]
-                                for _ in range(CONSTANTS['CD4_NUM_STRATA'])]
-                               for _ in range(CONSTANTS['CHRM_NUM'])],
-        'probPrevalentCHRMsRiskFactorLogit': [[0.0] * CONSTANTS['RISK_FACT_NUM']
-                                               for _ in range(CONSTANTS['CHRM_NUM'])],
-        'prevalentCHRMsMonthsSinceStartMean': [0.0] * CONSTANTS['CHRM_NUM'],
-        'prevalentCHRMsMonthsSinceStartStdDev': [0.0] * CONSTANTS['CHRM_NUM'],
-        'prevalentCHRMsMonthsSinceStartOrphans': [[0] * CONSTANTS['CHRM_ORPHANS_AGE_CAT_NUM']
-                                                   for _ in range(CONSTANTS['CHRM_NUM'])],
+        'probPrevalentCHRMsHIVneg': [[[0.0] * CHRM_AGE_CAT_NUM
+                                      for _ in range(GENDER_NUM)]
+                                     for _ in range(CHRM_NUM)],
+        'probPrevalentCHRMs': [[[[0.0] * CHRM_AGE_CAT_NUM
+                                 for _ in range(GENDER_NUM)]
+                                for _ in range(CD4_NUM_STRATA)]
+                               for _ in range(CHRM_NUM)],
+        'probPrevalentCHRMsRiskFactorLogit': [[0.0] * RISK_FACT_NUM
+                                               for _ in range(CHRM_NUM)],
+        'prevalentCHRMsMonthsSinceStartMean': [0.0] * CHRM_NUM,
+        'prevalentCHRMsMonthsSinceStartStdDev': [0.0] * CHRM_NUM,
+        'prevalentCHRMsMonthsSinceStartOrphans': [[0] * n_orphans_age
+                                                   for _ in range(CHRM_NUM)],
         'incidentCHRMsMonthsSincePreviousOrphans': 0,
-        'probIncidentCHRMsHIVneg': [[[0.0] * CONSTANTS['CHRM_AGE_CAT_NUM']
-                                     for _ in range(CONSTANTS['GENDER_NUM'])]
-                                    for _ in range(CONSTANTS['CHRM_NUM'])],
-        'probIncidentCHRMs': [[[[0.0] * CONSTANTS['CHRM_AGE_CAT_NUM']
-                                for _ in range(CONSTANTS['GENDER_NUM'])]
-                               for _ in range(CONSTANTS['CD4_NUM_STRATA'])]
-                              for _ in range(CONSTANTS['CHRM_NUM'])],
-        'probIncidentCHRMsOnARTMult': [[1.0] * CONSTANTS['CD4_NUM_STRATA']
-                                        for _ in range(CONSTANTS['CHRM_NUM'])],
-        'probIncidentCHRMsRiskFactorLogit': [[0.0] * CONSTANTS['RISK_FACT_NUM']
-                                              for _ in range(CONSTANTS['CHRM_NUM'])],
-        'probIncidentCHRMsPriorHistoryLogit': [[0.0] * CONSTANTS['CHRM_NUM']
-                                                for _ in range(CONSTANTS['CHRM_NUM'])],
-        'CHRMsDeathRateRatio': [[[[1.0] * CONSTANTS['CHRM_AGE_CAT_NUM']
-                                  for _ in range(CONSTANTS['GENDER_NUM'])]
-                                 for _ in range(CONSTANTS['CHRM_TIME_PER_NUM'])]
-                                for _ in range(CONSTANTS['CHRM_NUM'])],
-        'costCHRMs': [[[[0.0] * CONSTANTS['CHRM_AGE_CAT_NUM']
-                        for _ in range(CONSTANTS['GENDER_NUM'])]
-                       for _ in range(CONSTANTS['CHRM_TIME_PER_NUM'])]
-                      for _ in range(CONSTANTS['CHRM_NUM'])],
-        'costDeathCHRMs': [0.0] * CONSTANTS['CHRM_NUM'],
-        'QOLModCHRMs': [[[[1.0] * CONSTANTS['CHRM_AGE_CAT_NUM']
-                          for _ in range(CONSTANTS['GENDER_NUM'])]
-                         for _ in range(CONSTANTS['CHRM_TIME_PER_NUM'])]
-                        for _ in range(CONSTANTS['CHRM_NUM'])],
-        'QOLModDeathCHRMs': [1.0] * CONSTANTS['CHRM_NUM'],
-        'QOLModMultipleCHRMs': [1.0] * (CONSTANTS['CHRM_NUM'] - 1),
+        'probIncidentCHRMsHIVneg': [[[0.0] * CHRM_AGE_CAT_NUM
+                                     for _ in range(GENDER_NUM)]
+                                    for _ in range(CHRM_NUM)],
+        'probIncidentCHRMs': [[[[0.0] * CHRM_AGE_CAT_NUM
+                                for _ in range(GENDER_NUM)]
+                               for _ in range(CD4_NUM_STRATA)]
+                              for _ in range(CHRM_NUM)],
+        'probIncidentCHRMsOnARTMult': [[1.0] * CD4_NUM_STRATA
+                                        for _ in range(CHRM_NUM)],
+        'probIncidentCHRMsRiskFactorLogit': [[0.0] * RISK_FACT_NUM
+                                              for _ in range(CHRM_NUM)],
+        'probIncidentCHRMsPriorHistoryLogit': [[0.0] * CHRM_NUM
+                                                for _ in range(CHRM_NUM)],
+        'CHRMsDeathRateRatio': [[[[1.0] * CHRM_AGE_CAT_NUM
+                                  for _ in range(GENDER_NUM)]
+                                 for _ in range(n_time_per)]
+                                for _ in range(CHRM_NUM)],
+        'costCHRMs': [[[[0.0] * CHRM_AGE_CAT_NUM
+                        for _ in range(GENDER_NUM)]
+                       for _ in range(n_time_per)]
+                      for _ in range(CHRM_NUM)],
+        'costDeathCHRMs': [0.0] * CHRM_NUM,
+        'QOLModCHRMs': [[[[1.0] * CHRM_AGE_CAT_NUM
+                          for _ in range(GENDER_NUM)]
+                         for _ in range(n_time_per)]
+                        for _ in range(CHRM_NUM)],
+        'QOLModDeathCHRMs': [1.0] * CHRM_NUM,
+        'QOLModMultipleCHRMs': [1.0] * (CHRM_NUM - 1),
     }
 
 
@@ -630,11 +665,11 @@ def create_costs_defaults():
     """Costs tab defaults."""
     n_age = CONSTANTS['COST_AGE_CAT_NUM']
     n_art = CONSTANTS['ART_NUM_STATES']
-    n_oi = CONSTANTS['OI_NUM']
+    n_oi = OI_NUM
     n_dth = CONSTANTS['DTH_NUM_CAUSES_BASIC']
     n_cost = CONSTANTS['COST_NUM_TYPES']
-    n_gender = CONSTANTS['GENDER_NUM']
-    n_cd4 = CONSTANTS['CD4_NUM_STRATA']
+    n_gender = GENDER_NUM
+    n_cd4 = CD4_NUM_STRATA
 
     return {
         'costAgeBounds': [18, 25, 35, 45, 55, 65],
@@ -674,7 +709,7 @@ def create_tb_defaults():
     """TB tab defaults."""
     n_strains = CONSTANTS['TB_NUM_STRAINS']
     n_states = CONSTANTS['TB_NUM_STATES']
-    n_cd4 = CONSTANTS['CD4_NUM_STRATA']
+    n_cd4 = CD4_NUM_STRATA
     n_tests = CONSTANTS['TB_NUM_TESTS']
     n_treatments = CONSTANTS['TB_NUM_TREATMENTS']
     n_prophs = CONSTANTS['TB_NUM_PROPHS']
@@ -760,9 +795,9 @@ def create_qol_defaults():
     return {
         'QOLCalculationType': 0,  # MULT
         'QOLBaseHIVNegative': 1.0,
-        'QOLBaseHIVPositive': [[1.0] * CONSTANTS['CD4_NUM_STRATA']
+        'QOLBaseHIVPositive': [[1.0] * CD4_NUM_STRATA
                                for _ in range(CONSTANTS['ART_NUM_STATES'])],
-        'QOLAcuteOI': [1.0] * CONSTANTS['OI_NUM'],
+        'QOLAcuteOI': [1.0] * OI_NUM,
         'QOLDeathMonth': 0.0,
     }
 
@@ -820,46 +855,45 @@ def create_peds_defaults():
         # Initial distributions
         'pedsInitialCD4PercMean': 0.25,
         'pedsInitialCD4PercStdDev': 0.1,
-        'pedsInitialHVLDistribution': [0.0] * CONSTANTS['HVL_NUM_STRATA'],
+        'pedsInitialHVLDistribution': [0.0] * HVL_NUM_STRATA,
         # Death rate ratios
         'HIVDeathRateRatioPedsEarly': [[0.0] * PEDS_CD4_PERC_NUM for _ in range(PEDS_AGE_EARLY_NUM)],
-        'HIVDeathRateRatioPedsLate': [0.0] * CONSTANTS['CD4_NUM_STRATA'],
+        'HIVDeathRateRatioPedsLate': [0.0] * CD4_NUM_STRATA,
         'ARTDeathRateRatioPeds': [[1.0] * PEDS_AGE_CHILD_NUM for _ in range(3)],
-        'genericRiskDeathRateRatioPeds': [[1.0] * PEDS_AGE_CHILD_NUM for _ in range(CONSTANTS['RISK_FACT_NUM'])],
+        'genericRiskDeathRateRatioPeds': [[1.0] * PEDS_AGE_CHILD_NUM for _ in range(RISK_FACT_NUM)],
         # Background death rates
         'backgroundDeathRateMalePedsEarly': [0.0] * PEDS_AGE_EARLY_NUM,
         'backgroundDeathRateFemalePedsEarly': [0.0] * PEDS_AGE_EARLY_NUM,
         'backgroundDeathRateExposedMalePedsEarly': [0.0] * PEDS_AGE_EARLY_NUM,
         'backgroundDeathRateExposedFemalePedsEarly': [0.0] * PEDS_AGE_EARLY_NUM,
         # OI probabilities
-        'probOINoHistPedsEarly': [[[0.0] * PEDS_CD4_PERC_NUM for _ in range(PEDS_AGE_EARLY_NUM)] for _ in range(CONSTANTS['OI_NUM'])],
-        'probOIWithHistPedsEarly': [[[0.0] * PEDS_CD4_PERC_NUM for _ in range(PEDS_AGE_EARLY_NUM)] for _ in range(CONSTANTS['OI_NUM'])],
-        'probOINoHistPedsLate': [[0.0] * CONSTANTS['OI_NUM'] for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
-        'probOIWithHistPedsLate': [[0.0] * CONSTANTS['OI_NUM'] for _ in range(CONSTANTS['CD4_NUM_STRATA'])],
+        'probOINoHistPedsEarly': [[[0.0] * PEDS_CD4_PERC_NUM for _ in range(PEDS_AGE_EARLY_NUM)] for _ in range(OI_NUM)],
+        'probOIWithHistPedsEarly': [[[0.0] * PEDS_CD4_PERC_NUM for _ in range(PEDS_AGE_EARLY_NUM)] for _ in range(OI_NUM)],
+        'probOINoHistPedsLate': [[0.0] * OI_NUM for _ in range(CD4_NUM_STRATA)],
+        'probOIWithHistPedsLate': [[0.0] * OI_NUM for _ in range(CD4_NUM_STRATA)],
         # ART policies
         'maxPedsCD4Perc': [100.0] * PEDS_AGE_EARLY_NUM,
         'intvlCD4TestPreARTPeds': [3, 3],
         'intvlHVLTestPreARTPeds': [3, 3],
         # Peds prophylaxis start/stop
-        'priProphStartPedsAgeLwr': [0.0] * CONSTANTS['OI_NUM'],
-        'priProphStartPedsAgeUpp': [999.0] * CONSTANTS['OI_NUM'],
-        'priProphStartPedsCD4PercUpp': [100.0] * CONSTANTS['OI_NUM'],
-        'priProphStartPedsCD4PercLwr': [0.0] * CONSTANTS['OI_NUM'],
-        'priProphStartPedsOIHistory': [[0] * CONSTANTS['OI_NUM'] for _ in range(CONSTANTS['OI_NUM'])],
+        'priProphStartPedsAgeLwr': [0.0] * OI_NUM,
+        'priProphStartPedsAgeUpp': [999.0] * OI_NUM,
+        'priProphStartPedsCD4PercUpp': [100.0] * OI_NUM,
+        'priProphStartPedsCD4PercLwr': [0.0] * OI_NUM,
+        'priProphStartPedsOIHistory': [[0] * OI_NUM for _ in range(OI_NUM)],
         'priProphStartPedsCondFirst': 0,
         'priProphStartPedsCondSecond': 0,
         'priProphStartPedsCondPar': 0,
         # Peds ART start/fail/stop (simplified - full structure in generator)
         'pedsARTStartMthStage': [0, 0, 0],
-        'pedsARTStartCD4PercBounds': [[[100.0, 0.0] for _ in range(CONSTANTS['ART_NUM_LINES'])] for _ in range(4)],
-        'pedsARTStartHVLBounds': [[CONSTANTS['HVL_NUM_STRATA'], 0] for _ in range(CONSTANTS['ART_NUM_LINES'])],
+        'pedsARTStartCD4PercBounds': [[[100.0, 0.0] for _ in range(ART_NUM_LINES)] for _ in range(4)],
+        'pedsARTStartHVLBounds': [[HVL_NUM_STRATA, 0] for _ in range(ART_NUM_LINES)],
     }
 
 
 def create_pedsprophs_defaults():
     """PedsProphs tab defaults."""
-    PROPH_NUM = CONSTANTS['PROPH_NUM']
-    n_oi = CONSTANTS['OI_NUM']
+    n_oi = OI_NUM
 
     def default_peds_proph():
         return {
@@ -911,7 +945,7 @@ def create_pedsarts_defaults():
         }
 
     return {
-        'pedsARTData': [default_peds_art() for _ in range(CONSTANTS['ART_NUM_LINES'])]
+        'pedsARTData': [default_peds_art() for _ in range(ART_NUM_LINES)]
     }
 
 
@@ -919,10 +953,10 @@ def create_pedscosts_defaults():
     """PedsCosts tab defaults."""
     PEDS_COST_AGE_CAT_NUM = CONSTANTS['PEDS_COST_AGE_CAT_NUM']
     COST_NUM_TYPES = CONSTANTS['COST_NUM_TYPES']
-    n_oi = CONSTANTS['OI_NUM']
+    n_oi = OI_NUM
     DTH_NUM_CAUSES_BASIC = CONSTANTS['DTH_NUM_CAUSES_BASIC']
-    n_gender = CONSTANTS['GENDER_NUM']
-    n_cd4 = CONSTANTS['CD4_NUM_STRATA']
+    n_gender = GENDER_NUM
+    n_cd4 = CD4_NUM_STRATA
 
     def default_age_cat_costs():
         return {
@@ -1076,7 +1110,7 @@ def create_eid_defaults():
         # Visit costs
         'costVisit': [0.0] * EID_COST_VISIT_NUM,
         # OI detection
-        'probDetectionOnOI': [0.0] * CONSTANTS['OI_NUM'],
+        'probDetectionOnOI': [0.0] * OI_NUM,
         'probOIDetectionConfirmedLabTest': 0.0,
         'oiLabTestMonthsThreshold': 0,
         'oiAssayUnknownPos': [0, 0],
@@ -1091,10 +1125,10 @@ def create_eid_defaults():
 def create_adolescent_defaults():
     """Adolescent tab defaults."""
     ADOLESCENT_NUM_AGES = CONSTANTS['ADOLESCENT_NUM_AGES']
-    n_cd4 = CONSTANTS['CD4_NUM_STRATA']
-    n_hvl = CONSTANTS['HVL_NUM_STRATA']
-    n_oi = CONSTANTS['OI_NUM']
-    n_risk = CONSTANTS['RISK_FACT_NUM']
+    n_cd4 = CD4_NUM_STRATA
+    n_hvl = HVL_NUM_STRATA
+    n_oi = OI_NUM
+    n_risk = RISK_FACT_NUM
 
     return {
         'enableAdolescent': False,
@@ -1149,21 +1183,49 @@ def create_adolescentarts_defaults():
         }
 
     return {
-        'adolescentARTData': [default_adolescent_art() for _ in range(CONSTANTS['ART_NUM_LINES'])]
+        'adolescentARTData': [default_adolescent_art() for _ in range(ART_NUM_LINES)]
     }
 
 
+# Default builder for each input tab, in tab order
+TAB_DEFAULTS = {
+    'runspecs': create_runspecs_defaults,
+    'output': create_output_defaults,
+    'cohort': create_cohort_defaults,
+    'treatment': create_treatment_defaults,
+    'ltfu': create_ltfu_defaults,
+    'heterogeneity': create_heterogeneity_defaults,
+    'sti': create_sti_defaults,
+    'prophs': create_prophs_defaults,
+    'arts': create_arts_defaults,
+    'nathist': create_nathist_defaults,
+    'chrms': create_chrms_defaults,
+    'costs': create_costs_defaults,
+    'tb': create_tb_defaults,
+    'qol': create_qol_defaults,
+    'hivtest': create_hivtest_defaults,
+    'peds': create_peds_defaults,
+    'pedsprophs': create_pedsprophs_defaults,
+    'pedsarts': create_pedsarts_defaults,
+    'pedscosts': create_pedscosts_defaults,
+    'eid': create_eid_defaults,
+    'adolescent': create_adolescent_defaults,
+    'adolescentarts': create_adolescentarts_defaults,
+}
+
+
 # Keyword mapping for .in file parsing
-# Maps keywords to (tab, path) tuples
+# Maps keywords to (tab, path) tuples, or (tab, path, index) when the
+# keyword sets a single element of a list parameter
 KEYWORD_MAP = {
     # RunSpecs
     'Runset': ('runspecs', 'runSetName'),
     'CohortSize': ('runspecs', 'numCohorts'),
     'DiscFactor': ('runspecs', 'discountFactor'),
     'MaxPatCD4': ('runspecs', 'maxPatientCD4'),
-    'MthRecARTEffA': ('runspecs', 'monthRecordARTEfficacy[0]'),
-    'MthRecARTEffB': ('runspecs', 'monthRecordARTEfficacy[1]'),
-    'MthRecARTEffC': ('runspecs', 'monthRecordARTEfficacy[2]'),
+    'MthRecARTEffA': ('runspecs', 'monthRecordARTEfficacy', 0),
+    'MthRecARTEffB': ('runspecs', 'monthRecordARTEfficacy', 1),
+    'MthRecARTEffC': ('runspecs', 'monthRecordARTEfficacy', 2),
     'RandSeedByTime': ('runspecs', 'randomSeedByTime'),
     'UserLocale': ('runspecs', 'userProgramLocale'),
     'InpVer': ('runspecs', 'inputVersion'),
@@ -1216,6 +1278,18 @@ KEYWORD_MAP = {
     'ProbSwitchSecProph': ('treatment', 'probSwitchSecondaryProph'),
 }
 
+# Read-only view; the parser indexes below are derived from this mapping
+KEYWORD_MAP = MappingProxyType(KEYWORD_MAP)
+
+# Keywords grouped by the part before the first '_', so a composite token
+# like "ARTstart_CD4" can be matched to its keyword family without
+# re-splitting every keyword during parsing
+PREFIX_TO_KEYWORDS = {}
+for _kw in KEYWORD_MAP:
+    PREFIX_TO_KEYWORDS.setdefault(_kw.split('_', 1)[0], []).append(_kw)
+PREFIX_TO_KEYWORDS = {prefix: tuple(kws) for prefix, kws in PREFIX_TO_KEYWORDS.items()}
+del _kw
+
 
 def create_pmc9087297_params(risk_level='VHR', enable_prep=False):
     """Create parameters based on PMC9087297 paper.
@@ -1307,8 +1381,8 @@ def create_pmc9087297_params(risk_level='VHR', enable_prep=False):
 
     # === Cost Settings ===
     n_age = CONSTANTS['COST_AGE_CAT_NUM']
-    n_gender = CONSTANTS['GENDER_NUM']
-    n_cd4 = CONSTANTS['CD4_NUM_STRATA']
+    n_gender = GENDER_NUM
+    n_cd4 = CD4_NUM_STRATA
 
     # Routine HIV care: $3,280-$32,580/year = $273-$2,715/month
     # Use middle estimate for HIV+ on ART
@@ -1335,8 +1409,8 @@ def create_pmc9087297_params(risk_level='VHR', enable_prep=False):
     params['nathist']['ARTDeathRateRatio'] = 1.1
 
     # CD4 decline rates (monthly) by CD4/HVL strata
-    for cd4 in range(CONSTANTS['CD4_NUM_STRATA']):
-        for hvl in range(CONSTANTS['HVL_NUM_STRATA']):
+    for cd4 in range(CD4_NUM_STRATA):
+        for hvl in range(HVL_NUM_STRATA):
             # Higher HVL = faster CD4 decline
             base_decline = 2.0 + hvl * 0.5  # 2.0 to 5.0 cells/month
             params['nathist']['monthlyCD4DeclineMean'][cd4][hvl] = base_decline
@@ -1345,32 +1419,40 @@ def create_pmc9087297_params(risk_level='VHR', enable_prep=False):
     return params
 
 
+# Tab list and constants for the UI, built once at import. Kept as plain
+# dicts (inside a tuple) so the result can be passed straight to jsonify
+_PARAM_METADATA = {
+    'tabs': (
+        {'id': 'runspecs', 'name': 'Run Specs', 'description': 'Run configuration and cohort settings'},
+        {'id': 'output', 'name': 'Output', 'description': 'Output and tracing settings'},
+        {'id': 'cohort', 'name': 'Cohort', 'description': 'Initial population characteristics'},
+        {'id': 'treatment', 'name': 'Treatment', 'description': 'ART start, fail, and stop policies'},
+        {'id': 'ltfu', 'name': 'LTFU', 'description': 'Loss to follow-up parameters'},
+        {'id': 'heterogeneity', 'name': 'Heterogeneity', 'description': 'Response propensity settings'},
+        {'id': 'sti', 'name': 'STI', 'description': 'Structured treatment interruption'},
+        {'id': 'prophs', 'name': 'Prophylaxis', 'description': 'OI prophylaxis settings'},
+        {'id': 'arts', 'name': 'ARTs', 'description': 'ART regimen parameters'},
+        {'id': 'nathist', 'name': 'Natural History', 'description': 'Disease progression and mortality'},
+        {'id': 'chrms', 'name': 'CHRMs', 'description': 'Chronic conditions'},
+        {'id': 'costs', 'name': 'Costs', 'description': 'Cost parameters'},
+        {'id': 'tb', 'name': 'TB', 'description': 'Tuberculosis settings'},
+        {'id': 'qol', 'name': 'QOL', 'description': 'Quality of life modifiers'},
+        {'id': 'hivtest', 'name': 'HIV Testing', 'description': 'HIV testing and PrEP'},
+        {'id': 'peds', 'name': 'Pediatrics', 'description': 'Pediatric model settings'},
+        {'id': 'pedsprophs', 'name': 'Peds Prophs', 'description': 'Pediatric prophylaxis settings'},
+        {'id': 'pedsarts', 'name': 'Peds ARTs', 'description': 'Pediatric ART parameters'},
+        {'id': 'pedscosts', 'name': 'Peds Costs', 'description': 'Pediatric costs'},
+        {'id': 'eid', 'name': 'EID', 'description': 'Early infant diagnosis'},
+        {'id': 'adolescent', 'name': 'Adolescent', 'description': 'Adolescent settings'},
+        {'id': 'adolescentarts', 'name': 'Adolescent ARTs', 'description': 'Adolescent ART parameters'},
+    ),
+    'constants': dict(CONSTANTS),
+}
+
+
 def get_param_metadata():
-    """Get metadata about parameters for UI generation."""
-    return {
-        'tabs': [
-            {'id': 'runspecs', 'name': 'Run Specs', 'description': 'Run configuration and cohort settings'},
-            {'id': 'output', 'name': 'Output', 'description': 'Output and tracing settings'},
-            {'id': 'cohort', 'name': 'Cohort', 'description': 'Initial population characteristics'},
-            {'id': 'treatment', 'name': 'Treatment', 'description': 'ART start, fail, and stop policies'},
-            {'id': 'ltfu', 'name': 'LTFU', 'description': 'Loss to follow-up parameters'},
-            {'id': 'heterogeneity', 'name': 'Heterogeneity', 'description': 'Response propensity settings'},
-            {'id': 'sti', 'name': 'STI', 'description': 'Structured treatment interruption'},
-            {'id': 'prophs', 'name': 'Prophylaxis', 'description': 'OI prophylaxis settings'},
-            {'id': 'arts', 'name': 'ARTs', 'description': 'ART regimen parameters'},
-            {'id': 'nathist', 'name': 'Natural History', 'description': 'Disease progression and mortality'},
-            {'id': 'chrms', 'name': 'CHRMs', 'description': 'Chronic conditions'},
-            {'id': 'costs', 'name': 'Costs', 'description': 'Cost parameters'},
-            {'id': 'tb', 'name': 'TB', 'description': 'Tuberculosis settings'},
-            {'id': 'qol', 'name': 'QOL', 'description': 'Quality of life modifiers'},
-            {'id': 'hivtest', 'name': 'HIV Testing', 'description': 'HIV testing and PrEP'},
-            {'id': 'peds', 'name': 'Pediatrics', 'description': 'Pediatric model settings'},
-            {'id': 'pedsprophs', 'name': 'Peds Prophs', 'description': 'Pediatric prophylaxis settings'},
-            {'id': 'pedsarts', 'name': 'Peds ARTs', 'description': 'Pediatric ART parameters'},
-            {'id': 'pedscosts', 'name': 'Peds Costs', 'description': 'Pediatric costs'},
-            {'id': 'eid', 'name': 'EID', 'description': 'Early infant diagnosis'},
-            {'id': 'adolescent', 'name': 'Adolescent', 'description': 'Adolescent settings'},
-            {'id': 'adolescentarts', 'name': 'Adolescent ARTs', 'description': 'Adolescent ART parameters'},
-        ],
-        'constants': CONSTANTS,
-    }
+    """Get metadata about parameters for UI generation.
+
+    Returns a shared object; callers must not modify it.
+    """
+    return _PARAM_METADATA
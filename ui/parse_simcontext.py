@@ -7,65 +7,87 @@ This generates a complete list of keywords in the order they appear.
 import re
 import sys
 from collections import defaultdict
+from operator import methodcaller
 
-def parse_simcontext(filepath):
-    """Parse SimContext.cpp and extract all keywords."""
+# The patterns below are run over the raw bytes of the whole file, so they
+# use [^\S\n] (whitespace other than a newline) and exclude line endings
+# from their captures to keep every match within a single source line
 
-    with open(filepath, 'r') as f:
-        content = f.read()
+# Patterns for readAndSkipPast calls
+# readAndSkipPast("keyword", file)
+# readAndSkipPast2("keyword1", "keyword2", file) or readAndSkipPast2("keyword1", VAR, file)
+_PATTERN1 = re.compile(rb'readAndSkipPast[^\S\n]*\([^\S\n]*"([^"\r\n]+)"')
+_PATTERN2 = re.compile(rb'readAndSkipPast2[^\S\n]*\([^\S\n]*"([^"\r\n]+)"[^\S\n]*,[^\S\n]*"?([^",\)\r\n]+)"?')
 
-    # Track which function we're in
-    current_function = None
-    keywords_by_function = defaultdict(list)
-    all_keywords = []
+# Function definition pattern
+_FUNC_PATTERN = re.compile(rb'void[^\S\n]+SimContext::(\w+)[^\S\n]*\(')
 
-    # Patterns for readAndSkipPast calls
-    # readAndSkipPast("keyword", file)
-    # readAndSkipPast2("keyword1", "keyword2", file) or readAndSkipPast2("keyword1", VAR, file)
-    pattern1 = re.compile(r'readAndSkipPast\s*\(\s*"([^"]+)"')
-    pattern2 = re.compile(r'readAndSkipPast2\s*\(\s*"([^"]+)"\s*,\s*"?([^",\)]+)"?')
+_match_start = methodcaller('start')
 
-    # Also capture sprintf + readAndSkipPast patterns
-    sprintf_pattern = re.compile(r'sprintf\s*\(\s*\w+\s*,\s*"([^"]+)"')
 
-    # Function definition pattern
-    func_pattern = re.compile(r'void\s+SimContext::(\w+)\s*\(')
+def iter_parse_simcontext(filepath):
+    """Yield keyword entries from SimContext.cpp in source order."""
 
-    lines = content.split('\n')
+    # Read raw bytes; only the matched names are decoded
+    with open(filepath, 'rb') as f:
+        content = f.read()
 
-    for i, line in enumerate(lines):
-        # Check for function definitions
-        func_match = func_pattern.search(line)
-        if func_match:
-            current_function = func_match.group(1)
+    # Track which function we're in. Names are interned so repeated
+    # keywords and functions share one string across all entries
+    current_function = None
 
-        # Check for readAndSkipPast
-        match1 = pattern1.search(line)
-        if match1:
-            keyword = match1.group(1)
-            entry = {
+    # Sweep the whole file once per pattern, then replay the matches in
+    # source order. Sorting the few hundred matches is cheaper than a
+    # lazy heapq.merge of the three iterators
+    matches = [*_FUNC_PATTERN.finditer(content),
+               *_PATTERN1.finditer(content),
+               *_PATTERN2.finditer(content)]
+    matches.sort(key=_match_start)
+
+    # Line numbers are found by counting the newlines between matches
+    line_num = 1
+    prev_start = 0
+    for match in matches:
+        start = match.start()
+        line_num += content.count(b'\n', prev_start, start)
+        prev_start = start
+        pattern = match.re
+
+        # Function definitions
+        if pattern is _FUNC_PATTERN:
+            current_function = sys.intern(match.group(1).decode())
+
+        # readAndSkipPast
+        elif pattern is _PATTERN1:
+            keyword = sys.intern(match.group(1).decode())
+            yield {
                 'keyword': keyword,
                 'function': current_function,
-                'line': i + 1,
+                'line': line_num,
                 'type': 'single'
             }
-            keywords_by_function[current_function].append(entry)
-            all_keywords.append(entry)
-
-        # Check for readAndSkipPast2
-        match2 = pattern2.search(line)
-        if match2:
-            keyword1 = match2.group(1)
-            keyword2 = match2.group(2)
-            entry = {
+
+        # readAndSkipPast2
+        else:
+            keyword1 = sys.intern(match.group(1).decode())
+            keyword2 = sys.intern(match.group(2).decode())
+            yield {
                 'keyword': keyword1,
                 'keyword2': keyword2,
                 'function': current_function,
-                'line': i + 1,
+                'line': line_num,
                 'type': 'double'
             }
-            keywords_by_function[current_function].append(entry)
-            all_keywords.append(entry)
+
+
+def parse_simcontext(filepath):
+    """Parse SimContext.cpp and extract all keywords."""
+    keywords_by_function = defaultdict(list)
+    all_keywords = []
+
+    for entry in iter_parse_simcontext(filepath):
+        keywords_by_function[entry['function']].append(entry)
+        all_keywords.append(entry)
 
     return keywords_by_function, all_keywords
 
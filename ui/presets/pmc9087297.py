@@ -68,6 +68,14 @@ PAPER_PARAMS = {
     },
 }
 
+# Values derived from the paper parameters, computed once at import
+_PAPER_COSTS = PAPER_PARAMS['costs_2020_usd']
+_INITIAL_AGE_MEAN = float(PAPER_PARAMS['population']['mean_age_months'])
+_PREP_MONTHLY_COST = float(_PAPER_COSTS['generic_ftdf_monthly'])
+_ART_MONTHLY_COST = float(_PAPER_COSTS['art_min_monthly'])
+_ROUTINE_CARE_MONTHLY = (_PAPER_COSTS['routine_hiv_care_min_monthly'] +
+                         _PAPER_COSTS['routine_hiv_care_max_monthly']) / 2
+
 # Scenario definitions
 PMC9087297_SCENARIOS = {
     'PMC9087297_VHR_NoPrEP': {
@@ -137,22 +145,21 @@ def create_pmc9087297_params(risk_level='VHR', enable_prep=False):
     params['runspecs']['runSetName'] = 'PMC9087297'
     params['runspecs']['runName'] = f'PMC9087297_{risk_level}_{prep_suffix}'
     params['runspecs']['numCohorts'] = 10000
-    params['runspecs']['discountFactor'] = PAPER_PARAMS['population']['mean_age_years'] / 1000 + 0.0  # 0.03
-
     # Use exact paper discount rate
     params['runspecs']['discountFactor'] = PAPER_METADATA['discount_rate']
 
     # === Cohort Demographics ===
-    params['cohort']['initialAgeMean'] = float(PAPER_PARAMS['population']['mean_age_months'])
+    params['cohort']['initialAgeMean'] = _INITIAL_AGE_MEAN
     params['cohort']['initialAgeStdDev'] = 120.0  # ~10 years SD
     params['cohort']['maleGenderDistribution'] = PAPER_PARAMS['population']['gender_male_pct']
     params['cohort']['initialCD4Mean'] = float(cd4_at_infection)
     params['cohort']['initialCD4StdDev'] = 100.0
 
     # Initial HVL distribution - all start HIV-negative (HVLvhi = uninfected proxy)
-    # Set distribution to highest HVL stratum as placeholder for uninfected
-    for cd4_idx in range(CONSTANTS['CD4_NUM_STRATA']):
-        params['cohort']['initialHVLDistribution'][cd4_idx] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+    # Set distribution to highest HVL stratum as placeholder for uninfected.
+    # Rows are overwritten in place from constant tuples rather than replaced
+    for hvl_row in params['cohort']['initialHVLDistribution']:
+        hvl_row[:] = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
 
     # === HIV Testing ===
     params['hivtest']['enableHIVTesting'] = True
@@ -165,7 +172,7 @@ def create_pmc9087297_params(risk_level='VHR', enable_prep=False):
     # PrEP settings
     if enable_prep:
         params['hivtest']['enablePrEP'] = True
-        params['hivtest']['PrEPCostMonthly'] = float(PAPER_PARAMS['costs_2020_usd']['generic_ftdf_monthly'])
+        params['hivtest']['PrEPCostMonthly'] = _PREP_MONTHLY_COST
         params['hivtest']['PrEPEfficacy'] = 0.99  # ~99% efficacy with good adherence
         params['hivtest']['probPrEPDropout'] = 0.02
     else:
@@ -175,56 +182,58 @@ def create_pmc9087297_params(risk_level='VHR', enable_prep=False):
         params['hivtest']['probPrEPDropout'] = 0.0
 
     # === ART Treatment ===
-    art_monthly_cost = float(PAPER_PARAMS['costs_2020_usd']['art_min_monthly'])
     for art_line in params['arts']['artData']:
-        art_line['costMonthly'] = art_monthly_cost
+        art_line['costMonthly'] = _ART_MONTHLY_COST
         art_line['costInitial'] = 500.0
         art_line['efficacyTimeHorizon'] = 48
         # CD4 response on suppressive ART
         for resp_type in range(CONSTANTS['CD4_RESPONSE_NUM_TYPES']):
-            art_line['CD4ChangeOnSuppARTMean'][resp_type] = [10.0, 5.0, 2.0]
-            art_line['CD4ChangeOnSuppARTStdDev'][resp_type] = [5.0, 3.0, 1.0]
+            art_line['CD4ChangeOnSuppARTMean'][resp_type][:] = (10.0, 5.0, 2.0)
+            art_line['CD4ChangeOnSuppARTStdDev'][resp_type][:] = (5.0, 3.0, 1.0)
 
     # === QOL Settings ===
     qol_min, qol_max = PAPER_PARAMS['treatment']['qol_on_art_range']
     params['qol']['QOLBaseHIVNegative'] = 1.0
     # Off ART - lower QoL
-    params['qol']['QOLBaseHIVPositive'][0] = [0.75, 0.78, 0.80, 0.82, 0.84, 0.85]
+    params['qol']['QOLBaseHIVPositive'][0][:] = (0.75, 0.78, 0.80, 0.82, 0.84, 0.85)
     # On ART - QoL 0.83-0.87 by CD4 (low CD4 to high CD4)
-    params['qol']['QOLBaseHIVPositive'][1] = [qol_min, 0.84, 0.85, 0.86, qol_max, qol_max]
+    params['qol']['QOLBaseHIVPositive'][1][:] = (qol_min, 0.84, 0.85, 0.86, qol_max, qol_max)
 
     # === Cost Settings ===
     n_age = CONSTANTS['COST_AGE_CAT_NUM']
     n_gender = CONSTANTS['GENDER_NUM']
     n_cd4 = CONSTANTS['CD4_NUM_STRATA']
 
-    routine_care_monthly = (PAPER_PARAMS['costs_2020_usd']['routine_hiv_care_min_monthly'] +
-                           PAPER_PARAMS['costs_2020_usd']['routine_hiv_care_max_monthly']) / 2
-
-    for age_cat in range(n_age):
+    # Fill by walking the nested rows directly; routine care is indexed
+    # [ART state][CD4][gender][age][cost type]
+    costs = params['costs']
+    routine_care_off_art, routine_care_on_art = costs['routineCareCostHIVPositive'][:2]
+    for cd4 in range(n_cd4):
         for gender in range(n_gender):
-            for cd4 in range(n_cd4):
-                # Routine care costs (direct medical = index 0)
-                params['costs']['routineCareCostHIVPositive'][1][cd4][gender][age_cat][0] = routine_care_monthly * 0.5
-                params['costs']['routineCareCostHIVPositive'][0][cd4][gender][age_cat][0] = routine_care_monthly
+            # Routine care costs (direct medical = index 0)
+            for age_costs in routine_care_on_art[cd4][gender]:
+                age_costs[0] = _ROUTINE_CARE_MONTHLY * 0.5
+            for age_costs in routine_care_off_art[cd4][gender]:
+                age_costs[0] = _ROUTINE_CARE_MONTHLY
 
     for age_cat in range(n_age):
-        params['costs']['CD4TestCost'][age_cat][0] = 50.0
-        params['costs']['HVLTestCost'][age_cat][0] = 100.0
+        costs['CD4TestCost'][age_cat][0] = 50.0
+        costs['HVLTestCost'][age_cat][0] = 100.0
 
-    for age_cat in range(n_age):
-        for gender in range(n_gender):
-            params['costs']['generalMedicineCost'][gender][age_cat][0] = 200.0
+    for gender in range(n_gender):
+        for age_costs in costs['generalMedicineCost'][gender]:
+            age_costs[0] = 200.0
 
     # === Natural History ===
     params['nathist']['HIVDeathRateRatio'] = [5.0, 3.0, 2.0, 1.5, 1.2, 1.0]
     params['nathist']['ARTDeathRateRatio'] = 1.1
 
+    # CD4 decline depends only on HVL, so build one row and copy it per CD4 stratum
+    decline_mean = [2.0 + hvl * 0.5 for hvl in range(CONSTANTS['HVL_NUM_STRATA'])]
+    decline_std_dev = [base_decline * 0.3 for base_decline in decline_mean]
     for cd4 in range(CONSTANTS['CD4_NUM_STRATA']):
-        for hvl in range(CONSTANTS['HVL_NUM_STRATA']):
-            base_decline = 2.0 + hvl * 0.5
-            params['nathist']['monthlyCD4DeclineMean'][cd4][hvl] = base_decline
-            params['nathist']['monthlyCD4DeclineStdDev'][cd4][hvl] = base_decline * 0.3
+        params['nathist']['monthlyCD4DeclineMean'][cd4][:] = decline_mean
+        params['nathist']['monthlyCD4DeclineStdDev'][cd4][:] = decline_std_dev
 
     return params
 